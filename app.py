@@ -1,114 +1,93 @@
 import streamlit as st
-import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
-from io import BytesIO
-from datetime import datetime
 
-# PDF generation imports
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from thresholds import COND_IDX, HOUR_IDX, LANE_IDX, PCT_IDX, W1, W1_PCT_IDX, W2, W3, W4
+import csv
+import hashlib
+from collections import OrderedDict
+from io import BytesIO, StringIO
+from datetime import datetime
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+
+
+# Plotly only matters once results are rendered, so the import (and the
+# shared sizing template it registers) is deferred until then. The figure
+# builders below reference the module-level `go` published here.
+_PLOTLY_READY = False
+
+
+def _setup_plotly():
+    """Import plotly and register the shared chart template on first use."""
+    global _PLOTLY_READY, go, pio
+    if _PLOTLY_READY:
+        return
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    # Every chart shares the same compact sizing; registering it once as a
+    # template means each figure inherits it without a per-call layout merge
+    pio.templates['warrant'] = go.layout.Template(
+        layout=dict(height=280, margin=dict(l=20, r=20, t=30, b=40)))
+    pio.templates.default = 'plotly+warrant'
+    _PLOTLY_READY = True
 
 # =============================================================================
 # MUTCD 2009 THRESHOLD DATA
 # =============================================================================
 
-# Warrant 1: Table 4C-1
-WARRANT1_THRESHOLDS = {
-    'condition_a': {
-        (1, 1): {'100': (500, 150), '80': (400, 120), '70': (350, 105), '56': (280, 84)},
-        (2, 1): {'100': (600, 150), '80': (480, 120), '70': (420, 105), '56': (336, 84)},
-        (2, 2): {'100': (600, 200), '80': (480, 160), '70': (420, 140), '56': (336, 112)},
-        (1, 2): {'100': (500, 200), '80': (400, 160), '70': (350, 140), '56': (280, 112)},
-    },
-    'condition_b': {
-        (1, 1): {'100': (750, 75), '80': (600, 60), '70': (525, 53), '56': (420, 42)},
-        (2, 1): {'100': (900, 75), '80': (720, 60), '70': (630, 53), '56': (504, 42)},
-        (2, 2): {'100': (900, 100), '80': (720, 80), '70': (630, 70), '56': (504, 56)},
-        (1, 2): {'100': (750, 100), '80': (600, 80), '70': (525, 70), '56': (420, 56)},
-    }
-}
-
-# Warrant 2: Figure 4C-1 / 4C-2 curve points (major_vph, minor_vph threshold)
-WARRANT2_CURVES = {
-    '100': {
-        (1, 1): [(300, 115), (400, 100), (500, 90), (600, 80), (700, 70), (800, 60), (900, 50), (1000, 40)],
-        (2, 1): [(400, 115), (500, 100), (600, 90), (700, 80), (800, 70), (900, 60), (1000, 50), (1100, 40)],
-        (2, 2): [(400, 150), (500, 135), (600, 120), (700, 105), (800, 95), (900, 85), (1000, 75), (1100, 65)],
-        (1, 2): [(300, 150), (400, 135), (500, 120), (600, 105), (700, 95), (800, 85), (900, 75), (1000, 65)],
-    },
-    '70': {
-        (1, 1): [(210, 80), (280, 70), (350, 63), (420, 56), (490, 49), (560, 42), (630, 35), (700, 28)],
-        (2, 1): [(280, 80), (350, 70), (420, 63), (490, 56), (560, 49), (630, 42), (700, 35), (770, 28)],
-        (2, 2): [(280, 105), (350, 95), (420, 84), (490, 74), (560, 67), (630, 60), (700, 53), (770, 46)],
-        (1, 2): [(210, 105), (280, 95), (350, 84), (420, 74), (490, 67), (560, 60), (630, 53), (700, 46)],
-    }
-}
-
-# Warrant 3: Figure 4C-3 / 4C-4 curve points
-WARRANT3_CURVES = {
-    '100': {
-        (1, 1): [(400, 150), (500, 135), (600, 120), (700, 105), (800, 100), (900, 100), (1000, 100)],
-        (2, 1): [(500, 150), (600, 135), (700, 120), (800, 105), (900, 100), (1000, 100), (1100, 100)],
-        (2, 2): [(500, 200), (600, 180), (700, 160), (800, 150), (900, 150), (1000, 150), (1100, 150)],
-        (1, 2): [(400, 200), (500, 180), (600, 160), (700, 150), (800, 150), (900, 150), (1000, 150)],
-    },
-    '70': {
-        (1, 1): [(280, 105), (350, 95), (420, 84), (490, 74), (560, 70), (630, 70), (700, 70)],
-        (2, 1): [(350, 105), (420, 95), (490, 84), (560, 74), (630, 70), (700, 70), (770, 70)],
-        (2, 2): [(350, 140), (420, 126), (490, 112), (560, 105), (630, 105), (700, 105), (770, 105)],
-        (1, 2): [(280, 140), (350, 126), (420, 112), (490, 105), (560, 105), (630, 105), (700, 105)],
-    }
-}
-
-# Warrant 4: Pedestrian Volume - Figure 4C-5 through 4C-8
-WARRANT4_CURVES = {
-    'four_hour_100': [(300, 190), (400, 150), (500, 130), (600, 115), (700, 107), (800, 100), (900, 100), (1000, 100)],
-    'four_hour_70': [(210, 133), (280, 105), (350, 91), (420, 81), (490, 75), (560, 70), (630, 70), (700, 70)],
-    'peak_hour_100': [(300, 380), (400, 300), (500, 260), (600, 230), (700, 214), (800, 200), (900, 200), (1000, 200)],
-    'peak_hour_70': [(210, 266), (280, 210), (350, 182), (420, 161), (490, 150), (560, 140), (630, 140), (700, 140)],
-}
-
-
 def get_lane_key(major_lanes, minor_lanes):
     """Convert actual lane counts to threshold table keys (1 or 2+)"""
-    major = 1 if major_lanes == 1 else 2
-    minor = 1 if minor_lanes == 1 else 2
-    return (major, minor)
+    return (max(1, min(2, major_lanes)), max(1, min(2, minor_lanes)))
 
 
-def get_threshold_percentage(speed, population, is_combination=False):
-    """Determine which percentage column to use based on site conditions."""
-    has_reduction = speed > 40 or population < 10000
-    if is_combination:
-        return '56' if has_reduction else '80'
-    else:
-        return '70' if has_reduction else '100'
+def interpolate_threshold(xs, ys, major_vol):
+    """Given presorted curve arrays and major volume, interpolate minor street threshold."""
+    if major_vol < xs[0]:
+        return None
+    if major_vol >= xs[-1]:
+        return float(ys[-1])
+    # Binary search for the segment, then one linear interpolation in float64
+    i = int(np.searchsorted(xs, major_vol, side='right')) - 1
+    x1, x2 = float(xs[i]), float(xs[i + 1])
+    y1, y2 = float(ys[i]), float(ys[i + 1])
+    t = (major_vol - x1) / (x2 - x1)
+    return float(y1 + t * (y2 - y1))
 
 
-def interpolate_threshold(curve_points, major_vol):
-    """Given curve points and major volume, interpolate minor street threshold."""
-    points = sorted(curve_points, key=lambda x: x[0])
 
-    if major_vol < points[0][0]:
-        return None
-    if major_vol >= points[-1][0]:
-        return points[-1][1]
+_STREET_CACHE = {}
 
-    for i in range(len(points) - 1):
-        x1, y1 = points[i]
-        x2, y2 = points[i + 1]
-        if x1 <= major_vol < x2:
-            slope = (y2 - y1) / (x2 - x1)
-            return y1 + slope * (major_vol - x1)
 
-    return points[-1][1]
+def _select_streets(traffic_df):
+    """Pick major/minor columns by total volume, memoized per dataframe.
+
+    Returns (major_col, minor_col, major_arr, minor_arr). Keyed on the
+    dataframe identity plus a content hash so edits invalidate the entry,
+    letting all warrants in one rerun share a single pair of column scans.
+    """
+    key = (id(traffic_df), int(pd.util.hash_pandas_object(traffic_df, index=False).to_numpy().sum()))
+    cached = _STREET_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    s1 = traffic_df['Street 1 (vph)'].to_numpy()
+    s2 = traffic_df['Street 2 (vph)'].to_numpy()
+    if s1.sum() >= s2.sum():
+        result = ('Street 1 (vph)', 'Street 2 (vph)', s1, s2)
+    else:
+        result = ('Street 2 (vph)', 'Street 1 (vph)', s2, s1)
+
+    if len(_STREET_CACHE) > 8:
+        _STREET_CACHE.clear()
+    _STREET_CACHE[key] = result
+    return result
 
 
-def evaluate_warrant1(traffic_df, major_lanes, minor_lanes, speed, population):
+@st.cache_data(show_spinner=False)
+def evaluate_warrant1(traffic_df, major_lanes, minor_lanes, speed, population, streets=None,
+                      _w1=W1, _cond=COND_IDX, _lane=LANE_IDX, _pct=W1_PCT_IDX):
     """Evaluate Warrant 1: Eight-Hour Vehicular Volume"""
     if traffic_df is None or len(traffic_df) < 8:
         return {
@@ -118,49 +97,45 @@ def evaluate_warrant1(traffic_df, major_lanes, minor_lanes, speed, population):
         }
 
     lane_key = get_lane_key(major_lanes, minor_lanes)
-    pct = get_threshold_percentage(speed, population, is_combination=False)
-    pct_combo = get_threshold_percentage(speed, population, is_combination=True)
-
-    thresh_a = WARRANT1_THRESHOLDS['condition_a'][lane_key][pct]
-    thresh_b = WARRANT1_THRESHOLDS['condition_b'][lane_key][pct]
-    thresh_a_combo = WARRANT1_THRESHOLDS['condition_a'][lane_key][pct_combo]
-    thresh_b_combo = WARRANT1_THRESHOLDS['condition_b'][lane_key][pct_combo]
-
-    street1_total = traffic_df['Street 1 (vph)'].sum()
-    street2_total = traffic_df['Street 2 (vph)'].sum()
-
-    if street1_total >= street2_total:
-        major_col, minor_col = 'Street 1 (vph)', 'Street 2 (vph)'
-    else:
-        major_col, minor_col = 'Street 2 (vph)', 'Street 1 (vph)'
-
-    hours_a = hours_b = hours_a_combo = hours_b_combo = 0
-    hourly_results = []
-
-    for idx, row in traffic_df.iterrows():
-        major_vol = row[major_col]
-        minor_vol = row[minor_col]
-
-        meets_a = major_vol >= thresh_a[0] and minor_vol >= thresh_a[1]
-        meets_b = major_vol >= thresh_b[0] and minor_vol >= thresh_b[1]
-        meets_a_combo = major_vol >= thresh_a_combo[0] and minor_vol >= thresh_a_combo[1]
-        meets_b_combo = major_vol >= thresh_b_combo[0] and minor_vol >= thresh_b_combo[1]
-
-        if meets_a: hours_a += 1
-        if meets_b: hours_b += 1
-        if meets_a_combo: hours_a_combo += 1
-        if meets_b_combo: hours_b_combo += 1
-
-        hourly_results.append({
-            'hour': row['Hour'], 'major_vol': major_vol, 'minor_vol': minor_vol,
-            'meets_a': meets_a, 'meets_b': meets_b,
-            'thresh_a_major': thresh_a[0], 'thresh_a_minor': thresh_a[1],
-            'thresh_b_major': thresh_b[0], 'thresh_b_minor': thresh_b[1]
-        })
+    has_reduction = speed > 40 or population < 10000
+    pct = '70' if has_reduction else '100'
+    pct_combo = '56' if has_reduction else '80'
+
+    lane_i = _lane[lane_key]
+    thresh_a = _w1[_cond['a'], lane_i, _pct[pct]]
+    thresh_b = _w1[_cond['b'], lane_i, _pct[pct]]
+    thresh_a_combo = _w1[_cond['a'], lane_i, _pct[pct_combo]]
+    thresh_b_combo = _w1[_cond['b'], lane_i, _pct[pct_combo]]
+
+    major_col, minor_col, major_arr, minor_arr = streets if streets is not None else _select_streets(traffic_df)
+
+
+    meets_a = (major_arr >= thresh_a[0]) & (minor_arr >= thresh_a[1])
+    meets_b = (major_arr >= thresh_b[0]) & (minor_arr >= thresh_b[1])
+    meets_a_combo = (major_arr >= thresh_a_combo[0]) & (minor_arr >= thresh_a_combo[1])
+    meets_b_combo = (major_arr >= thresh_b_combo[0]) & (minor_arr >= thresh_b_combo[1])
+
+    hours_a = int(meets_a.sum())
+    hours_b = int(meets_b.sum())
+    hours_a_combo = int(meets_a_combo.sum())
+    hours_b_combo = int(meets_b_combo.sum())
+
+    cond_a_pair = tuple(map(int, thresh_a))
+    cond_b_pair = tuple(map(int, thresh_b))
+
+    hourly_results = [
+        {'hour': hour, 'major_vol': major_vol.item(), 'minor_vol': minor_vol.item(),
+         'meets_a': bool(m_a), 'meets_b': bool(m_b),
+         'thresh_a_major': cond_a_pair[0], 'thresh_a_minor': cond_a_pair[1],
+         'thresh_b_major': cond_b_pair[0], 'thresh_b_minor': cond_b_pair[1]}
+        for hour, major_vol, minor_vol, m_a, m_b
+        in zip(traffic_df['Hour'].to_numpy(), major_arr, minor_arr, meets_a, meets_b)
+    ]
 
     result = {
         'met': False, 'condition': None, 'hours_met': 0, 'details': '',
-        'threshold_used': {'pct': pct, 'condition_a': thresh_a, 'condition_b': thresh_b},
+        'threshold_used': {'pct': pct, 'condition_a': cond_a_pair,
+                           'condition_b': cond_b_pair},
         'hourly_results': hourly_results,
         'major_street': major_col.replace(' (vph)', ''),
         'minor_street': minor_col.replace(' (vph)', '')
@@ -182,7 +157,9 @@ def evaluate_warrant1(traffic_df, major_lanes, minor_lanes, speed, population):
     return result
 
 
-def evaluate_warrant2(traffic_df, major_lanes, minor_lanes, speed, population):
+@st.cache_data(show_spinner=False)
+def evaluate_warrant2(traffic_df, major_lanes, minor_lanes, speed, population, streets=None,
+                      _w2=W2, _lane=LANE_IDX, _pct=PCT_IDX):
     """Evaluate Warrant 2: Four-Hour Vehicular Volume"""
     if traffic_df is None or len(traffic_df) < 4:
         return {
@@ -193,33 +170,25 @@ def evaluate_warrant2(traffic_df, major_lanes, minor_lanes, speed, population):
 
     lane_key = get_lane_key(major_lanes, minor_lanes)
     pct = '70' if (speed > 40 or population < 10000) else '100'
-    curve_points = WARRANT2_CURVES[pct][lane_key]
-
-    street1_total = traffic_df['Street 1 (vph)'].sum()
-    street2_total = traffic_df['Street 2 (vph)'].sum()
-
-    if street1_total >= street2_total:
-        major_col, minor_col = 'Street 1 (vph)', 'Street 2 (vph)'
-    else:
-        major_col, minor_col = 'Street 2 (vph)', 'Street 1 (vph)'
-
-    hours_above = 0
-    hourly_results = []
+    curve_points = _w2[_pct[pct], _lane[lane_key]]
 
-    for idx, row in traffic_df.iterrows():
-        major_vol = row[major_col]
-        minor_vol = row[minor_col]
+    major_col, minor_col, major_arr, minor_arr = streets if streets is not None else _select_streets(traffic_df)
 
-        threshold = interpolate_threshold(curve_points, major_vol)
-        above_curve = threshold is not None and minor_vol >= threshold
+    xs, ys = curve_points[:, 0], curve_points[:, 1]
 
-        if above_curve:
-            hours_above += 1
+    # Below-range major volumes have no threshold; NaN compares as "not met"
+    thresholds = np.interp(major_arr, xs, ys)
+    thresholds[major_arr < xs[0]] = np.nan
+    above_curve = minor_arr >= thresholds
+    hours_above = int(above_curve.sum())
 
-        hourly_results.append({
-            'hour': row['Hour'], 'major_vol': major_vol, 'minor_vol': minor_vol,
-            'threshold': threshold, 'above_curve': above_curve
-        })
+    hourly_results = [
+        {'hour': hour, 'major_vol': major_vol.item(), 'minor_vol': minor_vol.item(),
+         'threshold': None if np.isnan(threshold) else float(threshold),
+         'above_curve': bool(above)}
+        for hour, major_vol, minor_vol, threshold, above
+        in zip(traffic_df['Hour'].to_numpy(), major_arr, minor_arr, thresholds, above_curve)
+    ]
 
     return {
         'met': hours_above >= 4,
@@ -233,7 +202,9 @@ def evaluate_warrant2(traffic_df, major_lanes, minor_lanes, speed, population):
     }
 
 
-def evaluate_warrant3(traffic_df, major_lanes, minor_lanes, speed, population):
+@st.cache_data(show_spinner=False)
+def evaluate_warrant3(traffic_df, major_lanes, minor_lanes, speed, population, streets=None,
+                      _w3=W3, _lane=LANE_IDX, _pct=PCT_IDX):
     """Evaluate Warrant 3: Peak Hour"""
     if traffic_df is None or len(traffic_df) < 1:
         return {
@@ -243,26 +214,17 @@ def evaluate_warrant3(traffic_df, major_lanes, minor_lanes, speed, population):
 
     lane_key = get_lane_key(major_lanes, minor_lanes)
     pct = '70' if (speed > 40 or population < 10000) else '100'
-    curve_points = WARRANT3_CURVES[pct][lane_key]
+    curve_points = _w3[_pct[pct], _lane[lane_key]]
 
-    street1_total = traffic_df['Street 1 (vph)'].sum()
-    street2_total = traffic_df['Street 2 (vph)'].sum()
-
-    if street1_total >= street2_total:
-        major_col, minor_col = 'Street 1 (vph)', 'Street 2 (vph)'
-    else:
-        major_col, minor_col = 'Street 2 (vph)', 'Street 1 (vph)'
+    major_col, minor_col, major_arr, minor_arr = streets if streets is not None else _select_streets(traffic_df)
 
-    traffic_df = traffic_df.copy()
-    traffic_df['total'] = traffic_df[major_col] + traffic_df[minor_col]
-    peak_idx = traffic_df['total'].idxmax()
-    peak_row = traffic_df.loc[peak_idx]
+    peak_i = int((major_arr + minor_arr).argmax())
 
-    peak_major = peak_row[major_col]
-    peak_minor = peak_row[minor_col]
-    peak_hour = peak_row['Hour']
+    peak_major = major_arr[peak_i]
+    peak_minor = minor_arr[peak_i]
+    peak_hour = traffic_df['Hour'].iat[peak_i]
 
-    threshold = interpolate_threshold(curve_points, peak_major)
+    threshold = interpolate_threshold(curve_points[:, 0], curve_points[:, 1], peak_major)
     above_curve = threshold is not None and peak_minor >= threshold
 
     detail_str = f"{'MET' if above_curve else 'NOT MET'}: Peak hour ({peak_hour}) - {peak_minor:.0f} vph vs {threshold:.0f} vph threshold ({pct}%)" if threshold else "NOT MET: Major volume below curve range"
@@ -281,7 +243,9 @@ def evaluate_warrant3(traffic_df, major_lanes, minor_lanes, speed, population):
     }
 
 
-def evaluate_warrant4(traffic_df, speed, population, ped_peak, ped_4hr, gaps_per_hour, dist_to_signal):
+@st.cache_data(show_spinner=False)
+def evaluate_warrant4(traffic_df, speed, population, ped_peak, ped_4hr, gaps_per_hour, dist_to_signal,
+                      streets=None, _w4=W4, _hour=HOUR_IDX, _pct=PCT_IDX):
     """Evaluate Warrant 4: Pedestrian Volume"""
     if dist_to_signal < 300:
         return {
@@ -306,8 +270,9 @@ def evaluate_warrant4(traffic_df, speed, population, ped_peak, ped_4hr, gaps_per
     use_70 = speed > 35 or population < 10000
     pct = '70' if use_70 else '100'
 
-    four_hour_curve = WARRANT4_CURVES[f'four_hour_{pct}']
-    peak_hour_curve = WARRANT4_CURVES[f'peak_hour_{pct}']
+    pct_i = _pct[pct]
+    four_hour_curve = _w4[_hour['four_hour'], pct_i]
+    peak_hour_curve = _w4[_hour['peak_hour'], pct_i]
 
     if traffic_df is None or len(traffic_df) < 1:
         return {
@@ -318,16 +283,16 @@ def evaluate_warrant4(traffic_df, speed, population, ped_peak, ped_4hr, gaps_per
             'peak_hour_met': False
         }
 
-    street1_total = traffic_df['Street 1 (vph)'].sum()
-    street2_total = traffic_df['Street 2 (vph)'].sum()
-    major_col = 'Street 1 (vph)' if street1_total >= street2_total else 'Street 2 (vph)'
+    major_col, minor_col, major_arr, minor_arr = streets if streets is not None else _select_streets(traffic_df)
 
-    top_4_major = traffic_df.nlargest(4, major_col)[major_col].mean()
-    four_hr_threshold = interpolate_threshold(four_hour_curve, top_4_major)
+    # One O(N) partition yields both the top-4 average and the peak hour max
+    top4 = np.partition(major_arr, -4)[-4:] if major_arr.size > 4 else major_arr
+    top_4_major = top4.mean()
+    four_hr_threshold = interpolate_threshold(four_hour_curve[:, 0], four_hour_curve[:, 1], top_4_major)
     four_hour_met = four_hr_threshold is not None and ped_4hr >= four_hr_threshold
 
-    peak_major = traffic_df[major_col].max()
-    peak_hr_threshold = interpolate_threshold(peak_hour_curve, peak_major)
+    peak_major = top4.max()
+    peak_hr_threshold = interpolate_threshold(peak_hour_curve[:, 0], peak_hour_curve[:, 1], peak_major)
     peak_hour_met = peak_hr_threshold is not None and ped_peak >= peak_hr_threshold
 
     met = four_hour_met or peak_hour_met
@@ -354,47 +319,97 @@ def evaluate_warrant4(traffic_df, speed, population, ped_peak, ped_4hr, gaps_per
         'peak_hour_threshold': peak_hr_threshold,
         'pct': pct,
         'gaps_per_hour': gaps_per_hour,
+        'major_col': major_col,
+        'peak_major': int(peak_major),
         'four_hour_curve': four_hour_curve,
         'peak_hour_curve': peak_hour_curve
     }
 
 
+class _ResultRecord:
+    """Read-only dict-style access so records and plain result dicts interchange."""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+@dataclass(slots=True, frozen=True)
+class Warrant5Result(_ResultRecord):
+    met: bool | None
+    details: str
+    children: int
+    gaps: int
+
+
+@dataclass(slots=True, frozen=True)
+class Warrant6Result(_ResultRecord):
+    met: bool | None
+    details: str
+    signal_spacing: int
+    progression_speed: int
+    engineering_judgment: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class Warrant8Result(_ResultRecord):
+    met: bool | None
+    details: str
+    route_designation: bool
+    future_volumes: bool
+    engineering_judgment: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class Warrant9Result(_ResultRecord):
+    met: bool | None
+    details: str
+    train_frequency: int
+    queuing_distance: int
+    preemption_needed: bool
+
+
+@lru_cache(maxsize=128)
 def evaluate_warrant5(school_crossing, school_children, school_gaps, crossing_period_minutes=30):
     """Evaluate Warrant 5: School Crossing"""
     if not school_crossing:
-        return {
-            'met': None,
-            'details': 'No school crossing designated',
-            'children': school_children,
-            'gaps': school_gaps
-        }
+        return Warrant5Result(
+            met=None,
+            details='No school crossing designated',
+            children=school_children,
+            gaps=school_gaps
+        )
 
     if school_children < 20:
-        return {
-            'met': False,
-            'details': f'NOT MET: {school_children} schoolchildren < 20 minimum',
-            'children': school_children,
-            'gaps': school_gaps
-        }
+        return Warrant5Result(
+            met=False,
+            details=f'NOT MET: {school_children} schoolchildren < 20 minimum',
+            children=school_children,
+            gaps=school_gaps
+        )
 
     gaps_ok = school_gaps < crossing_period_minutes
 
     if gaps_ok:
-        return {
-            'met': True,
-            'details': f'MET: {school_children} children, {school_gaps} gaps < {crossing_period_minutes} min period',
-            'children': school_children,
-            'gaps': school_gaps
-        }
+        return Warrant5Result(
+            met=True,
+            details=f'MET: {school_children} children, {school_gaps} gaps < {crossing_period_minutes} min period',
+            children=school_children,
+            gaps=school_gaps
+        )
     else:
-        return {
-            'met': False,
-            'details': f'NOT MET: {school_gaps} adequate gaps >= {crossing_period_minutes} min crossing period',
-            'children': school_children,
-            'gaps': school_gaps
-        }
+        return Warrant5Result(
+            met=False,
+            details=f'NOT MET: {school_gaps} adequate gaps >= {crossing_period_minutes} min crossing period',
+            children=school_children,
+            gaps=school_gaps
+        )
 
 
+@lru_cache(maxsize=128)
 def evaluate_warrant6(coordinated_system, signal_spacing, progression_speed):
     """
     Evaluate Warrant 6: Coordinated Signal System
@@ -407,12 +422,12 @@ def evaluate_warrant6(coordinated_system, signal_spacing, progression_speed):
     Note: This is primarily an engineering judgment warrant
     """
     if not coordinated_system:
-        return {
-            'met': None,
-            'details': 'Not part of coordinated system',
-            'signal_spacing': signal_spacing,
-            'progression_speed': progression_speed
-        }
+        return Warrant6Result(
+            met=None,
+            details='Not part of coordinated system',
+            signal_spacing=signal_spacing,
+            progression_speed=progression_speed
+        )
 
     # MUTCD guidance: signals should be spaced for good progression
     # Typical guidance: 1000-2640 ft spacing depending on progression speed
@@ -422,25 +437,28 @@ def evaluate_warrant6(coordinated_system, signal_spacing, progression_speed):
     spacing_ok = min_spacing <= signal_spacing <= max_spacing
 
     if spacing_ok:
-        return {
-            'met': True,
-            'details': f'MET: {signal_spacing} ft spacing within {min_spacing}-{max_spacing} ft range',
-            'signal_spacing': signal_spacing,
-            'progression_speed': progression_speed,
-            'engineering_judgment': True
-        }
+        return Warrant6Result(
+            met=True,
+            details=f'MET: {signal_spacing} ft spacing within {min_spacing}-{max_spacing} ft range',
+            signal_spacing=signal_spacing,
+            progression_speed=progression_speed,
+            engineering_judgment=True
+        )
     else:
-        return {
-            'met': False,
-            'details': f'NOT MET: {signal_spacing} ft spacing outside {min_spacing}-{max_spacing} ft range',
-            'signal_spacing': signal_spacing,
-            'progression_speed': progression_speed,
-            'engineering_judgment': True
-        }
+        return Warrant6Result(
+            met=False,
+            details=f'NOT MET: {signal_spacing} ft spacing outside {min_spacing}-{max_spacing} ft range',
+            signal_spacing=signal_spacing,
+            progression_speed=progression_speed,
+            engineering_judgment=True
+        )
 
 
+@st.cache_data(show_spinner=False)
 def evaluate_warrant7(traffic_df, major_lanes, minor_lanes, speed, population,
-                      correctable_crashes, alternatives_tried):
+                      correctable_crashes, alternatives_tried, streets=None,
+                      include_hourly=True, _w1=W1, _w3=W3, _cond=COND_IDX,
+                      _lane=LANE_IDX, _w1pct=W1_PCT_IDX, _pct=PCT_IDX):
     """
     Evaluate Warrant 7: Crash Experience
 
@@ -497,56 +515,53 @@ def evaluate_warrant7(traffic_df, major_lanes, minor_lanes, speed, population,
     lane_key = get_lane_key(major_lanes, minor_lanes)
 
     # Get 80% thresholds from Warrant 1
-    thresh_a_80 = WARRANT1_THRESHOLDS['condition_a'][lane_key]['80']
-    thresh_b_80 = WARRANT1_THRESHOLDS['condition_b'][lane_key]['80']
+    lane_i = _lane[lane_key]
+    thresh_a_80 = _w1[_cond['a'], lane_i, _w1pct['80']]
+    thresh_b_80 = _w1[_cond['b'], lane_i, _w1pct['80']]
+    thresh_a_pair = tuple(map(int, thresh_a_80))
+    thresh_b_pair = tuple(map(int, thresh_b_80))
 
     # Get Warrant 3 curve (use 100% for Warrant 7 per MUTCD)
     pct = '70' if (speed > 40 or population < 10000) else '100'
-    curve_points = WARRANT3_CURVES[pct][lane_key]
+    curve_points = _w3[_pct[pct], _lane[lane_key]]
 
     # Determine major/minor streets
-    street1_total = traffic_df['Street 1 (vph)'].sum()
-    street2_total = traffic_df['Street 2 (vph)'].sum()
-
-    if street1_total >= street2_total:
-        major_col, minor_col = 'Street 1 (vph)', 'Street 2 (vph)'
-    else:
-        major_col, minor_col = 'Street 2 (vph)', 'Street 1 (vph)'
-
-    hours_meeting_volume = 0
-    hourly_results = []
-
-    for idx, row in traffic_df.iterrows():
-        major_vol = row[major_col]
-        minor_vol = row[minor_col]
-
-        # Check 80% of Warrant 1 Condition A
-        meets_w1_a = major_vol >= thresh_a_80[0] and minor_vol >= thresh_a_80[1]
-
-        # Check 80% of Warrant 1 Condition B
-        meets_w1_b = major_vol >= thresh_b_80[0] and minor_vol >= thresh_b_80[1]
-
-        # Check Warrant 3 curve
-        w3_threshold = interpolate_threshold(curve_points, major_vol)
-        meets_w3 = w3_threshold is not None and minor_vol >= w3_threshold
-
-        meets_volume = meets_w1_a or meets_w1_b or meets_w3
-
-        if meets_volume:
-            hours_meeting_volume += 1
-
-        hourly_results.append({
-            'hour': row['Hour'],
-            'major_vol': major_vol,
-            'minor_vol': minor_vol,
-            'meets_w1_a': meets_w1_a,
-            'meets_w1_b': meets_w1_b,
-            'meets_w3': meets_w3,
-            'meets_volume': meets_volume,
-            'thresh_a': thresh_a_80,
-            'thresh_b': thresh_b_80,
-            'w3_threshold': w3_threshold
-        })
+    major_col, minor_col, major_arr, minor_arr = streets if streets is not None else _select_streets(traffic_df)
+
+    xs, ys = curve_points[:, 0], curve_points[:, 1]
+
+    # Interpolate the full Warrant 3 threshold column in one shot;
+    # NaN marks major volumes below the curve range
+    w3_thresholds = np.interp(major_arr, xs, ys)
+    w3_thresholds[major_arr < xs[0]] = np.nan
+
+    # Fused volume test: 80% of Warrant 1 Condition A or B, or above the
+    # Warrant 3 curve, evaluated as four array ops over the whole day
+    meets_w1_a = (major_arr >= thresh_a_80[0]) & (minor_arr >= thresh_a_80[1])
+    meets_w1_b = (major_arr >= thresh_b_80[0]) & (minor_arr >= thresh_b_80[1])
+    meets_w3 = minor_arr >= w3_thresholds
+    meets_volume = meets_w1_a | meets_w1_b | meets_w3
+    hours_meeting_volume = int(meets_volume.sum())
+
+    # The per-hour dicts only feed the detail chart; skip building them
+    # when the caller just needs the pass/fail summary
+    hourly_results = None
+    if include_hourly:
+        hourly_results = [
+            {'hour': hour,
+             'major_vol': major_vol.item(),
+             'minor_vol': minor_vol.item(),
+             'meets_w1_a': bool(m_a),
+             'meets_w1_b': bool(m_b),
+             'meets_w3': bool(m_3),
+             'meets_volume': bool(m_vol),
+             'thresh_a': thresh_a_pair,
+             'thresh_b': thresh_b_pair,
+             'w3_threshold': None if np.isnan(w3_threshold) else float(w3_threshold)}
+            for hour, major_vol, minor_vol, m_a, m_b, m_3, m_vol, w3_threshold
+            in zip(traffic_df['Hour'].to_numpy(), major_arr, minor_arr,
+                   meets_w1_a, meets_w1_b, meets_w3, meets_volume, w3_thresholds)
+        ]
 
     condition_c_met = hours_meeting_volume >= 8
 
@@ -560,8 +575,8 @@ def evaluate_warrant7(traffic_df, major_lanes, minor_lanes, speed, population,
             'correctable_crashes': correctable_crashes,
             'hours_meeting_volume': hours_meeting_volume,
             'hourly_results': hourly_results,
-            'thresh_a_80': thresh_a_80,
-            'thresh_b_80': thresh_b_80,
+            'thresh_a_80': thresh_a_pair,
+            'thresh_b_80': thresh_b_pair,
             'curve_points': curve_points,
             'pct': pct,
             'major_street': major_col.replace(' (vph)', ''),
@@ -577,8 +592,8 @@ def evaluate_warrant7(traffic_df, major_lanes, minor_lanes, speed, population,
             'correctable_crashes': correctable_crashes,
             'hours_meeting_volume': hours_meeting_volume,
             'hourly_results': hourly_results,
-            'thresh_a_80': thresh_a_80,
-            'thresh_b_80': thresh_b_80,
+            'thresh_a_80': thresh_a_pair,
+            'thresh_b_80': thresh_b_pair,
             'curve_points': curve_points,
             'pct': pct,
             'major_street': major_col.replace(' (vph)', ''),
@@ -586,6 +601,7 @@ def evaluate_warrant7(traffic_df, major_lanes, minor_lanes, speed, population,
         }
 
 
+@lru_cache(maxsize=128)
 def evaluate_warrant8(network_continuity, route_designation, future_volumes):
     """
     Evaluate Warrant 8: Roadway Network
@@ -598,40 +614,37 @@ def evaluate_warrant8(network_continuity, route_designation, future_volumes):
     Note: This is primarily an engineering judgment warrant
     """
     if not network_continuity:
-        return {
-            'met': None,
-            'details': 'Network continuity not applicable',
-            'route_designation': route_designation,
-            'future_volumes': future_volumes,
-            'engineering_judgment': True
-        }
+        return Warrant8Result(
+            met=None,
+            details='Network continuity not applicable',
+            route_designation=route_designation,
+            future_volumes=future_volumes
+        )
 
     if route_designation and future_volumes:
-        return {
-            'met': True,
-            'details': f'MET: Route designation confirmed, projected volumes support installation',
-            'route_designation': route_designation,
-            'future_volumes': future_volumes,
-            'engineering_judgment': True
-        }
+        return Warrant8Result(
+            met=True,
+            details='MET: Route designation confirmed, projected volumes support installation',
+            route_designation=route_designation,
+            future_volumes=future_volumes
+        )
     elif route_designation:
-        return {
-            'met': False,
-            'details': 'NOT MET: Route designated but projected volumes insufficient',
-            'route_designation': route_designation,
-            'future_volumes': future_volumes,
-            'engineering_judgment': True
-        }
+        return Warrant8Result(
+            met=False,
+            details='NOT MET: Route designated but projected volumes insufficient',
+            route_designation=route_designation,
+            future_volumes=future_volumes
+        )
     else:
-        return {
-            'met': False,
-            'details': 'NOT MET: Not on designated route network',
-            'route_designation': route_designation,
-            'future_volumes': future_volumes,
-            'engineering_judgment': True
-        }
+        return Warrant8Result(
+            met=False,
+            details='NOT MET: Not on designated route network',
+            route_designation=route_designation,
+            future_volumes=future_volumes
+        )
 
 
+@lru_cache(maxsize=128)
 def evaluate_warrant9(railroad_crossing, train_frequency, queuing_distance, preemption_needed):
     """
     Evaluate Warrant 9: Intersection Near a Grade Crossing
@@ -644,236 +657,384 @@ def evaluate_warrant9(railroad_crossing, train_frequency, queuing_distance, pree
     Note: This warrant has specific geometric and operational requirements
     """
     if not railroad_crossing:
-        return {
-            'met': None,
-            'details': 'No railroad grade crossing nearby',
-            'train_frequency': train_frequency,
-            'queuing_distance': queuing_distance,
-            'preemption_needed': preemption_needed
-        }
+        return Warrant9Result(
+            met=None,
+            details='No railroad grade crossing nearby',
+            train_frequency=train_frequency,
+            queuing_distance=queuing_distance,
+            preemption_needed=preemption_needed
+        )
 
     # Check distance requirement (within 140 ft per MUTCD)
     if queuing_distance > 140:
-        return {
-            'met': False,
-            'details': f'NOT MET: Distance ({queuing_distance} ft) exceeds 140 ft maximum',
-            'train_frequency': train_frequency,
-            'queuing_distance': queuing_distance,
-            'preemption_needed': preemption_needed
-        }
+        return Warrant9Result(
+            met=False,
+            details=f'NOT MET: Distance ({queuing_distance} ft) exceeds 140 ft maximum',
+            train_frequency=train_frequency,
+            queuing_distance=queuing_distance,
+            preemption_needed=preemption_needed
+        )
 
     if train_frequency > 0 and preemption_needed:
-        return {
-            'met': True,
-            'details': f'MET: {train_frequency} trains/day, {queuing_distance} ft from crossing, preemption required',
-            'train_frequency': train_frequency,
-            'queuing_distance': queuing_distance,
-            'preemption_needed': preemption_needed
-        }
+        return Warrant9Result(
+            met=True,
+            details=f'MET: {train_frequency} trains/day, {queuing_distance} ft from crossing, preemption required',
+            train_frequency=train_frequency,
+            queuing_distance=queuing_distance,
+            preemption_needed=preemption_needed
+        )
     else:
-        return {
-            'met': False,
-            'details': 'NOT MET: Insufficient train activity or preemption not needed',
-            'train_frequency': train_frequency,
-            'queuing_distance': queuing_distance,
-            'preemption_needed': preemption_needed
-        }
+        return Warrant9Result(
+            met=False,
+            details='NOT MET: Insufficient train activity or preemption not needed',
+            train_frequency=train_frequency,
+            queuing_distance=queuing_distance,
+            preemption_needed=preemption_needed
+        )
 
 
 # =============================================================================
 # EXPORT FUNCTIONS
 # =============================================================================
 
-def generate_excel_report(results_df, traffic_df, project_info):
-    """Generate Excel workbook with warrant analysis results"""
-    output = BytesIO()
+# reportlab is heavy to import and most sessions never download a PDF,
+# so the import and the shared style objects are deferred to first use
+_PDF_STYLES_BUILT = False
 
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Summary sheet
-        results_df.to_excel(writer, sheet_name='Warrant Summary', index=False)
-
-        # Traffic data sheet
-        if traffic_df is not None:
-            traffic_df.to_excel(writer, sheet_name='Traffic Counts', index=False)
-
-        # Project info sheet
-        info_df = pd.DataFrame([
-            ['Project Name', project_info.get('project_name', '')],
-            ['Location', project_info.get('location', '')],
-            ['Street 1', project_info.get('street_1', '')],
-            ['Street 2', project_info.get('street_2', '')],
-            ['Approach Speed (mph)', project_info.get('approach_speed', '')],
-            ['Population', project_info.get('population', '')],
-            ['Lanes - Street 1', project_info.get('lanes_1', '')],
-            ['Lanes - Street 2', project_info.get('lanes_2', '')],
-            ['Distance to Signal (ft)', project_info.get('dist_signal', '')],
-            ['Report Generated', datetime.now().strftime('%Y-%m-%d %H:%M')]
-        ], columns=['Parameter', 'Value'])
-        info_df.to_excel(writer, sheet_name='Project Info', index=False)
-
-    output.seek(0)
-    return output
 
+def _build_styles():
+    """Import reportlab and build the shared style objects on first use."""
+    global _PDF_STYLES_BUILT
+    if _PDF_STYLES_BUILT:
+        return
+    global letter, inch, colors
+    global SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, PageBreak, HRFlowable
+    global _STYLES, _TITLE_STYLE, _HEADING_STYLE, _NORMAL_STYLE, _FOOTER_STYLE
+    global _PROJECT_TABLE_STYLE, _RESULTS_TABLE_STYLE, _TRAFFIC_TABLE_STYLE, _STATIC_FOOTER
 
-def generate_csv_report(results_df):
-    """Generate CSV of warrant summary"""
-    output = BytesIO()
-    results_df.to_csv(output, index=False)
-    output.seek(0)
-    return output
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+                                    PageBreak, LongTable, HRFlowable)
 
+    _STYLES = getSampleStyleSheet()
 
-def generate_pdf_report(results_df, traffic_df, project_info, warrant_results):
-    """Generate professional PDF report of warrant analysis"""
-    output = BytesIO()
-    doc = SimpleDocTemplate(output, pagesize=letter,
-                            topMargin=0.75 * inch, bottomMargin=0.75 * inch,
-                            leftMargin=0.75 * inch, rightMargin=0.75 * inch)
-
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
+    _TITLE_STYLE = ParagraphStyle(
         'CustomTitle',
-        parent=styles['Title'],
+        parent=_STYLES['Title'],
         fontSize=18,
         spaceAfter=20,
         textColor=colors.HexColor('#1e2a3a')
     )
 
-    heading_style = ParagraphStyle(
+    _HEADING_STYLE = ParagraphStyle(
         'CustomHeading',
-        parent=styles['Heading2'],
+        parent=_STYLES['Heading2'],
         fontSize=14,
         spaceBefore=15,
         spaceAfter=10,
         textColor=colors.HexColor('#1e2a3a')
     )
 
-    normal_style = ParagraphStyle(
+    _NORMAL_STYLE = ParagraphStyle(
         'CustomNormal',
-        parent=styles['Normal'],
+        parent=_STYLES['Normal'],
         fontSize=10,
         spaceAfter=6
     )
 
+    _FOOTER_STYLE = ParagraphStyle('Footer', parent=_NORMAL_STYLE, fontSize=8, textColor=colors.grey)
+
+    _PROJECT_TABLE_STYLE = TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ])
+
+    _RESULTS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e2a3a')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+    ])
+
+    _TRAFFIC_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e2a3a')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+    ])
+
+    _STATIC_FOOTER = [
+        Spacer(1, 30),
+        # A rule flowable draws one line primitive where the old em-dash
+        # Paragraph laid out sixty separate glyphs
+        HRFlowable(width="100%", thickness=0.5, color=colors.grey, spaceBefore=6, spaceAfter=6),
+        Paragraph("Report generated by MUTCD Warrant Pro | MUTCD 2009 Edition", _FOOTER_STYLE),
+        Paragraph(
+            "This analysis is for planning purposes only. Final signal installation decisions should be made by a licensed Professional Engineer.",
+            _FOOTER_STYLE),
+    ]
+
+    _PDF_STYLES_BUILT = True
+
+
+def _to_stream(data, out_stream):
+    """Wrap rendered bytes in a fresh BytesIO or write through to the caller's stream."""
+    if out_stream is None:
+        return BytesIO(data)
+    out_stream.write(data)
+    return out_stream
+
+
+def generate_excel_report(results_df, traffic_df, project_info, out_stream=None):
+    """Generate Excel workbook with warrant analysis results"""
+    from openpyxl import Workbook
+
+    output = BytesIO() if out_stream is None else out_stream
+
+    # write_only mode streams each appended row straight to XML (through
+    # lxml's C serializer when installed) instead of holding every cell of
+    # all three sheets in memory until save
+    wb = Workbook(write_only=True)
+
+    # Summary sheet
+    summary_ws = wb.create_sheet('Warrant Summary')
+    summary_ws.append(list(results_df.columns))
+    for row in results_df.itertuples(index=False, name=None):
+        summary_ws.append(row)
+
+    # Traffic data sheet — the one sheet that can grow, so pull the block
+    # out of pandas once and feed rows from the ndarray
+    if traffic_df is not None:
+        traffic_ws = wb.create_sheet('Traffic Counts')
+        traffic_ws.append(list(traffic_df.columns))
+        for row in traffic_df.to_numpy():
+            traffic_ws.append(row.tolist())
+
+    # Project info sheet — ten rows, so append them straight to the
+    # write_only sheet rather than round-tripping through a DataFrame
+    info_ws = wb.create_sheet('Project Info')
+    info_ws.append(['Parameter', 'Value'])
+    for row in [
+        ['Project Name', project_info.get('project_name', '')],
+        ['Location', project_info.get('location', '')],
+        ['Street 1', project_info.get('street_1', '')],
+        ['Street 2', project_info.get('street_2', '')],
+        ['Approach Speed (mph)', project_info.get('approach_speed', '')],
+        ['Population', project_info.get('population', '')],
+        ['Lanes - Street 1', project_info.get('lanes_1', '')],
+        ['Lanes - Street 2', project_info.get('lanes_2', '')],
+        ['Distance to Signal (ft)', project_info.get('dist_signal', '')],
+        ['Report Generated', datetime.now().strftime('%Y-%m-%d %H:%M')]
+    ]:
+        info_ws.append(row)
+
+    wb.save(output)
+    if out_stream is None:
+        output.seek(0)
+    return output
+
+
+def generate_csv_report(results_df, out_stream=None):
+    """Generate CSV of warrant summary"""
+    # The summary has a handful of fixed string columns, so the stdlib
+    # writer beats pandas' dtype-aware to_csv machinery here
+    buf = StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(results_df.columns.tolist())
+    writer.writerows(results_df.itertuples(index=False, name=None))
+    return _to_stream(buf.getvalue().encode('utf-8'), out_stream)
+
+
+# Footer flowables carry no layout state between builds, so one shared
+# set serves every report
+@lru_cache(maxsize=1)
+def _empty_pdf_bytes():
+    """One-page placeholder returned when there are no results to report."""
+    _build_styles()
+    output = BytesIO()
+    doc = SimpleDocTemplate(output, pagesize=letter,
+                            topMargin=0.75 * inch, bottomMargin=0.75 * inch,
+                            leftMargin=0.75 * inch, rightMargin=0.75 * inch)
+    story = [
+        Paragraph("MUTCD Signal Warrant Analysis Report", _TITLE_STYLE),
+        Paragraph("No warrant results available — run an analysis first.", _NORMAL_STYLE),
+    ]
+    story.extend(_STATIC_FOOTER)
+    doc.build(story)
+    return output.getvalue()
+
+
+# Re-downloading an unchanged report is common in the Streamlit flow, so
+# keep the rendered bytes of the last few PDFs keyed by input content
+_PDF_CACHE = OrderedDict()
+_PDF_CACHE_MAX = 16
+
+
+def _pdf_cache_key(results_df, traffic_df, project_info):
+    """Stable content hash of the inputs that shape the PDF."""
+    h = hashlib.blake2b(pd.util.hash_pandas_object(results_df, index=False).values.tobytes())
+    if traffic_df is not None:
+        h.update(pd.util.hash_pandas_object(traffic_df, index=False).values.tobytes())
+    h.update(repr(sorted(project_info.items())).encode())
+    return h.digest()
+
+
+def generate_pdf_report(results_df, traffic_df, project_info, warrant_results, out_stream=None):
+    """Generate professional PDF report of warrant analysis"""
+    _build_styles()
+    if results_df is None or results_df.empty:
+        return _to_stream(_empty_pdf_bytes(), out_stream)
+
+    key = _pdf_cache_key(results_df, traffic_df, project_info)
+    cached = _PDF_CACHE.get(key)
+    if cached is not None:
+        _PDF_CACHE.move_to_end(key)
+        return _to_stream(cached, out_stream)
+
+    # Always render into a local buffer so the bytes can be memoized,
+    # then hand them to the caller's stream if one was supplied
+    output = BytesIO()
+    doc = SimpleDocTemplate(output, pagesize=letter,
+                            topMargin=0.75 * inch, bottomMargin=0.75 * inch,
+                            leftMargin=0.75 * inch, rightMargin=0.75 * inch)
+
     story = []
 
     # Title
-    story.append(Paragraph("MUTCD Signal Warrant Analysis Report", title_style))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y at %H:%M')}", normal_style))
+    story.append(Paragraph("MUTCD Signal Warrant Analysis Report", _TITLE_STYLE))
+    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y at %H:%M')}", _NORMAL_STYLE))
     story.append(Spacer(1, 20))
 
     # Project Information
-    story.append(Paragraph("Project Information", heading_style))
+    story.append(Paragraph("Project Information", _HEADING_STYLE))
+
+    # Pull every field out of project_info once instead of repeated .get()
+    # calls interleaved with inline formatting
+    pdata = {k: project_info.get(k, 'N/A')
+             for k in ('project_name', 'location', 'street_1', 'street_2',
+                       'approach_speed', 'population', 'lanes_1', 'lanes_2', 'dist_signal')}
+    population = f"{pdata['population']:,}" if isinstance(pdata['population'], (int, float)) else 'N/A'
 
     project_data = [
-        ['Project Name:', project_info.get('project_name', 'N/A')],
-        ['Location:', project_info.get('location', 'N/A')],
-        ['Street 1:', project_info.get('street_1', 'N/A')],
-        ['Street 2:', project_info.get('street_2', 'N/A')],
-        ['Approach Speed:', f"{project_info.get('approach_speed', 'N/A')} mph"],
-        ['Population:', f"{project_info.get('population', 'N/A'):,}" if project_info.get('population') else 'N/A'],
-        ['Lane Configuration:', f"{project_info.get('lanes_1', 'N/A')} x {project_info.get('lanes_2', 'N/A')}"],
-        ['Distance to Nearest Signal:', f"{project_info.get('dist_signal', 'N/A')} ft"],
+        ['Project Name:', pdata['project_name']],
+        ['Location:', pdata['location']],
+        ['Street 1:', pdata['street_1']],
+        ['Street 2:', pdata['street_2']],
+        ['Approach Speed:', f"{pdata['approach_speed']} mph"],
+        ['Population:', population],
+        ['Lane Configuration:', f"{pdata['lanes_1']} x {pdata['lanes_2']}"],
+        ['Distance to Nearest Signal:', f"{pdata['dist_signal']} ft"],
     ]
 
     project_table = Table(project_data, colWidths=[2 * inch, 4 * inch])
-    project_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    project_table.setStyle(_PROJECT_TABLE_STYLE)
     story.append(project_table)
     story.append(Spacer(1, 20))
 
     # Warrant Analysis Summary
-    story.append(Paragraph("Warrant Analysis Summary", heading_style))
+    story.append(Paragraph("Warrant Analysis Summary", _HEADING_STYLE))
 
-    # Count met warrants
-    met_count = sum(1 for _, row in results_df.iterrows() if '✓' in str(row['Status']))
+    # Count met warrants — every met status begins with the check mark,
+    # so a prefix test beats scanning each string for a substring
+    met_mask = results_df['Status'].astype(str).str.startswith('✓').to_numpy()
+    met_count = int(met_mask.sum())
     if met_count > 0:
         story.append(
-            Paragraph(f"<b>{met_count} warrant(s) satisfied</b> — Signal installation may be justified", normal_style))
+            Paragraph(f"<b>{met_count} warrant(s) satisfied</b> — Signal installation may be justified", _NORMAL_STYLE))
     else:
         story.append(Paragraph("<b>No warrants currently satisfied</b> — Additional data or conditions may be needed",
-                               normal_style))
+                               _NORMAL_STYLE))
     story.append(Spacer(1, 10))
 
-    # Results table
+    # Results table and detail notes built in one pass over the results
     table_data = [['Warrant', 'Status', 'Data', 'Threshold']]
-    for _, row in results_df.iterrows():
-        table_data.append([
-            row['Warrant'],
-            row['Status'],
-            row['Data'],
-            row['Threshold']
-        ])
+    notes = []
+    for warrant, status, data, threshold, note in results_df[
+            ['Warrant', 'Status', 'Data', 'Threshold', 'Notes']].itertuples(index=False, name=None):
+        table_data.append([warrant, status, data, threshold])
+        if note and note != '—':
+            notes.append((warrant, note))
 
     results_table = Table(table_data, colWidths=[1.8 * inch, 1 * inch, 1.5 * inch, 1.5 * inch])
-    results_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e2a3a')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-    ]))
+    results_table.setStyle(_RESULTS_TABLE_STYLE)
     story.append(results_table)
     story.append(Spacer(1, 20))
 
-    # Detailed Notes
-    story.append(Paragraph("Detailed Analysis Notes", heading_style))
-    for _, row in results_df.iterrows():
-        if row['Notes'] and row['Notes'] != '—':
-            story.append(Paragraph(f"<b>{row['Warrant']}:</b> {row['Notes']}", normal_style))
+    # Detailed Notes — one Paragraph for all notes so reportlab runs its
+    # wrap/measure pass once instead of once per note
+    story.append(Paragraph("Detailed Analysis Notes", _HEADING_STYLE))
+    if notes:
+        notes_html = '<br/><br/>'.join(f"<b>{warrant}:</b> {note}" for warrant, note in notes)
+        story.append(Paragraph(notes_html, _NORMAL_STYLE))
 
     story.append(PageBreak())
 
     # Traffic Data (if available)
     if traffic_df is not None and len(traffic_df) > 0:
-        story.append(Paragraph("Traffic Count Data", heading_style))
-
-        traffic_table_data = [['Hour', 'Street 1 (vph)', 'Street 2 (vph)']]
-        for _, row in traffic_df.iterrows():
-            traffic_table_data.append([
-                str(row['Hour']),
-                str(int(row['Street 1 (vph)'])),
-                str(int(row['Street 2 (vph)']))
-            ])
-
-        traffic_table = Table(traffic_table_data, colWidths=[1.5 * inch, 1.5 * inch, 1.5 * inch])
-        traffic_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e2a3a')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-        ]))
+        story.append(Paragraph("Traffic Count Data", _HEADING_STYLE))
+
+        t = traffic_df[['Hour', 'Street 1 (vph)', 'Street 2 (vph)']].astype(
+            {'Street 1 (vph)': 'int64', 'Street 2 (vph)': 'int64'})
+        traffic_table_data = [['Hour', 'Street 1 (vph)', 'Street 2 (vph)']] + [
+            [str(hour), str(s1), str(s2)]
+            for hour, s1, s2 in t.itertuples(index=False, name=None)
+        ]
+
+        # LongTable splits across pages row by row instead of measuring the
+        # whole table at once, and repeats the header on each page
+        traffic_table = LongTable(traffic_table_data, colWidths=[1.5 * inch, 1.5 * inch, 1.5 * inch],
+                                  repeatRows=1)
+        traffic_table.setStyle(_TRAFFIC_TABLE_STYLE)
         story.append(traffic_table)
         story.append(Spacer(1, 20))
 
     # Footer
-    story.append(Spacer(1, 30))
-    story.append(Paragraph("—" * 60, normal_style))
-    story.append(Paragraph("Report generated by MUTCD Warrant Pro | MUTCD 2009 Edition",
-                           ParagraphStyle('Footer', parent=normal_style, fontSize=8, textColor=colors.grey)))
-    story.append(Paragraph(
-        "This analysis is for planning purposes only. Final signal installation decisions should be made by a licensed Professional Engineer.",
-        ParagraphStyle('Disclaimer', parent=normal_style, fontSize=8, textColor=colors.grey)))
+    story.extend(_STATIC_FOOTER)
 
     doc.build(story)
-    output.seek(0)
-    return output
+    data = output.getvalue()
+    _PDF_CACHE[key] = data
+    while len(_PDF_CACHE) > _PDF_CACHE_MAX:
+        _PDF_CACHE.popitem(last=False)
+    if out_stream is None:
+        output.seek(0)
+        return output
+    return _to_stream(data, out_stream)
+
+
+def generate_all_reports(results_df, traffic_df, project_info, warrant_results):
+    """Generate all three export artifacts for the download buttons."""
+    return {
+        'pdf': generate_pdf_report(results_df, traffic_df, project_info, warrant_results),
+        'xlsx': generate_excel_report(results_df, traffic_df, project_info),
+        'csv': generate_csv_report(results_df),
+    }
+
+
+# The download buttons need their payloads on every rerun, so cache the
+# rendered bytes across reruns with unchanged inputs. warrant_results is
+# excluded from the key (leading underscore): the reports are fully
+# determined by the frames and project info.
+@st.cache_data(show_spinner=False)
+def _report_payloads(results_df, traffic_df, project_info, _warrant_results):
+    reports = generate_all_reports(results_df, traffic_df, project_info, _warrant_results)
+    return {fmt: stream.getvalue() for fmt, stream in reports.items()}
 
 
 # =============================================================================
@@ -887,7 +1048,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-st.markdown("""
+# The style block never changes, so keep it as one constant and emit it
+# through a cached function; Streamlit replays the recorded element on
+# reruns instead of re-diffing a fresh markdown call
+_APP_CSS = """
 <style>
     [data-testid="stSidebar"] {
         background-color: #1e2a3a;
@@ -931,7 +1095,15 @@ st.markdown("""
     #MainMenu {visibility: hidden;}
     footer {visibility: hidden;}
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _inject_css():
+    st.markdown(_APP_CSS, unsafe_allow_html=True)
+
+
+_inject_css()
 
 # Initialize session state
 if 'current_page' not in st.session_state:
@@ -952,8 +1124,7 @@ if 'analysis_run' not in st.session_state:
 
 # Sidebar
 with st.sidebar:
-    st.markdown("### 🚦 MUTCD Warrant Pro")
-    st.markdown("---")
+    st.markdown("### 🚦 MUTCD Warrant Pro\n\n---")
 
     page = st.radio(
         "Navigation",
@@ -963,21 +1134,27 @@ with st.sidebar:
     )
     st.session_state.current_page = page
 
-    st.markdown("---")
-
+    # One markdown element instead of three (rule, badge, rule)
     st.markdown("""
+    ---
+
     <div class="version-indicator">
         <strong>MUTCD Version</strong><br>
         2009 Edition
     </div>
-    """, unsafe_allow_html=True)
 
-    st.markdown("---")
+    ---
+    """, unsafe_allow_html=True)
 
     if st.button("📊 Run Analysis", use_container_width=True, type="primary"):
         st.session_state.analysis_run = True
         st.rerun()
 
+    if st.session_state.analysis_run:
+        # Lets users hide the results section (columns, charts, exports)
+        # while they iterate on inputs, skipping that work per rerun
+        st.toggle("Show results", key="results_visible", value=True)
+
     st.markdown("---")
     st.caption("📥 Export options available after running analysis on the Traffic Counts page")
 
@@ -985,34 +1162,39 @@ with st.sidebar:
 def render_project_details():
     st.markdown("## Project Details")
 
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.text_input("Project Name", key="project_name",
-                      value=st.session_state.project_data['project_name'],
-                      placeholder="Enter project name")
-        st.text_input("Location/Description", key="location",
-                      placeholder="e.g., Main St & Oak Ave")
-
-        st.subheader("Street Information")
-        st.text_input("Street 1 Name", key="street_1", placeholder="e.g., Main Street")
-        st.text_input("Street 2 Name", key="street_2", placeholder="e.g., Oak Avenue")
-        st.caption("System will auto-assign major/minor based on volumes")
-
-    with col2:
-        st.subheader("Site Characteristics")
-        st.number_input("Approach Speed (mph)", min_value=15, max_value=70, value=35, key="approach_speed",
-                        help="Posted speed limit or 85th percentile speed on major street")
-        st.selectbox("Area Type", ["Urban", "Rural"], key="area_type")
-        st.number_input("Community Population", min_value=100, max_value=10000000,
-                        value=10000, key="population",
-                        help="Used for 70% threshold reduction if < 10,000")
-
-        st.subheader("Lane Configuration")
-        st.number_input("Lanes - Street 1", min_value=1, max_value=6, value=2, key="lanes_1")
-        st.number_input("Lanes - Street 2", min_value=1, max_value=6, value=1, key="lanes_2")
-        st.number_input("Distance to Nearest Signal (ft)", min_value=0, max_value=10000,
-                        value=1000, key="dist_signal")
+    # Batch the whole page into one form so edits apply on a single
+    # submit rerun instead of one rerun per keystroke
+    with st.form("project_details_form", border=False):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.text_input("Project Name", key="project_name",
+                          value=st.session_state.project_data['project_name'],
+                          placeholder="Enter project name")
+            st.text_input("Location/Description", key="location",
+                          placeholder="e.g., Main St & Oak Ave")
+
+            st.subheader("Street Information")
+            st.text_input("Street 1 Name", key="street_1", placeholder="e.g., Main Street")
+            st.text_input("Street 2 Name", key="street_2", placeholder="e.g., Oak Avenue")
+            st.caption("System will auto-assign major/minor based on volumes")
+
+        with col2:
+            st.subheader("Site Characteristics")
+            st.number_input("Approach Speed (mph)", min_value=15, max_value=70, value=35, key="approach_speed",
+                            help="Posted speed limit or 85th percentile speed on major street")
+            st.selectbox("Area Type", ["Urban", "Rural"], key="area_type")
+            st.number_input("Community Population", min_value=100, max_value=10000000,
+                            value=10000, key="population",
+                            help="Used for 70% threshold reduction if < 10,000")
+
+            st.subheader("Lane Configuration")
+            st.number_input("Lanes - Street 1", min_value=1, max_value=6, value=2, key="lanes_1")
+            st.number_input("Lanes - Street 2", min_value=1, max_value=6, value=1, key="lanes_2")
+            st.number_input("Distance to Nearest Signal (ft)", min_value=0, max_value=10000,
+                            value=1000, key="dist_signal")
+
+        st.form_submit_button("💾 Apply Changes", use_container_width=True)
 
 
 def render_traffic_counts():
@@ -1027,10 +1209,12 @@ def render_traffic_counts():
 
         if 'traffic_df' not in st.session_state:
             hours = [f"{h}:00" for h in range(6, 22)]
+            # Counts are capped at 9999 in the editor, so int16 columns hold
+            # them in a quarter of the default int64 footprint
             st.session_state.traffic_df = pd.DataFrame({
                 'Hour': hours,
-                'Street 1 (vph)': [0] * 16,
-                'Street 2 (vph)': [0] * 16
+                'Street 1 (vph)': np.zeros(16, dtype=np.int16),
+                'Street 2 (vph)': np.zeros(16, dtype=np.int16)
             })
 
         street1_name = st.session_state.get('street_1', 'Street 1') or 'Street 1'
@@ -1060,12 +1244,21 @@ def render_traffic_counts():
         uploaded_file = st.file_uploader("Upload CSV", type=['csv'], label_visibility="collapsed")
         if uploaded_file:
             try:
-                csv_df = pd.read_csv(uploaded_file)
+                # Only 12-24 hourly rows matter, so cap the parse instead of
+                # loading an arbitrarily large upload into memory
+                if uploaded_file.size > 1_000_000:
+                    st.error("File too large — expected a small hourly counts CSV (under 1 MB)")
+                    st.stop()
+                csv_df = pd.read_csv(uploaded_file, nrows=24)
                 if 'Hour' in csv_df.columns and len(csv_df.columns) >= 3:
                     csv_df.columns = ['Hour', 'Street 1 (vph)', 'Street 2 (vph)'][:len(csv_df.columns)]
+                    count_cols = ['Street 1 (vph)', 'Street 2 (vph)']
+                    # Uploads aren't bound by the editor's 0-9999 cap, so
+                    # clamp before the downcast — int16 would silently
+                    # wrap anything larger
+                    csv_df[count_cols] = csv_df[count_cols].clip(0, 9999).astype('int16')
                     st.session_state.traffic_df = csv_df
                     st.success("CSV loaded")
-                    st.rerun()
                 else:
                     st.error("CSV must have Hour, Street 1, Street 2 columns")
             except Exception as e:
@@ -1074,9 +1267,13 @@ def render_traffic_counts():
         st.markdown("---")
         st.subheader("Data Summary")
         df = st.session_state.traffic_df
-        total_s1 = df['Street 1 (vph)'].sum()
-        total_s2 = df['Street 2 (vph)'].sum()
-        hours_with_data = len(df[(df['Street 1 (vph)'] > 0) | (df['Street 2 (vph)'] > 0)])
+        # Work on the underlying arrays: one pass each, no boolean Series
+        # or filtered-frame copies just to take a length
+        s1 = df['Street 1 (vph)'].to_numpy()
+        s2 = df['Street 2 (vph)'].to_numpy()
+        total_s1 = int(s1.sum())
+        total_s2 = int(s2.sum())
+        hours_with_data = int(((s1 > 0) | (s2 > 0)).sum())
 
         st.metric("Hours with data", hours_with_data)
         st.metric("Street 1 Total", f"{total_s1:,} vph")
@@ -1091,26 +1288,31 @@ def render_traffic_counts():
 def render_pedestrian_bike():
     st.markdown("## Pedestrian & Bicycle Data")
 
-    col1, col2 = st.columns(2)
+    # Batch the whole page into one form so edits apply on a single
+    # submit rerun instead of one rerun per keystroke
+    with st.form("ped_bike_form", border=False):
+        col1, col2 = st.columns(2)
 
-    with col1:
-        st.subheader("Pedestrian Counts")
-        st.number_input("Peak Hour Pedestrians (crossing major street)",
-                        min_value=0, max_value=5000, value=0, key="ped_peak")
-        st.number_input("4-Hour Average Pedestrians/Hour",
-                        min_value=0, max_value=2000, value=0, key="ped_4hr")
+        with col1:
+            st.subheader("Pedestrian Counts")
+            st.number_input("Peak Hour Pedestrians (crossing major street)",
+                            min_value=0, max_value=5000, value=0, key="ped_peak")
+            st.number_input("4-Hour Average Pedestrians/Hour",
+                            min_value=0, max_value=2000, value=0, key="ped_4hr")
 
-        st.subheader("Gap Study")
-        st.number_input("Adequate Gaps per Hour", min_value=0, max_value=200, value=60, key="gaps",
-                        help="Number of gaps adequate for pedestrian crossing")
+            st.subheader("Gap Study")
+            st.number_input("Adequate Gaps per Hour", min_value=0, max_value=200, value=60, key="gaps",
+                            help="Number of gaps adequate for pedestrian crossing")
 
-    with col2:
-        st.subheader("School Crossing (Warrant 5)")
-        st.checkbox("School crossing present", key="school_crossing")
-        st.number_input("Schoolchildren at Peak Crossing Hour",
-                        min_value=0, max_value=500, value=0, key="school_children")
-        st.number_input("Adequate Gaps During School Crossing",
-                        min_value=0, max_value=200, value=0, key="school_gaps")
+        with col2:
+            st.subheader("School Crossing (Warrant 5)")
+            st.checkbox("School crossing present", key="school_crossing")
+            st.number_input("Schoolchildren at Peak Crossing Hour",
+                            min_value=0, max_value=500, value=0, key="school_children")
+            st.number_input("Adequate Gaps During School Crossing",
+                            min_value=0, max_value=200, value=0, key="school_gaps")
+
+        st.form_submit_button("💾 Apply Changes", use_container_width=True)
 
 
 def render_crash_data():
@@ -1119,31 +1321,36 @@ def render_crash_data():
     st.info(
         "📋 **MUTCD Requirement:** 5+ crashes correctable by signal within a **12-month period**, plus volume thresholds and documented trial of alternatives.")
 
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.subheader("12-Month Crash History")
-        st.number_input("Total Reportable Crashes (12 months)", min_value=0, max_value=100, value=0,
-                        key="total_crashes",
-                        help="All crashes meeting state reporting threshold in the past 12 months")
-        st.number_input("Crashes Correctable by Signal", min_value=0, max_value=100, value=0,
-                        key="correctable_crashes",
-                        help="Right-angle, left-turn, and pedestrian crashes typically correctable by signal")
-
-    with col2:
-        st.subheader("Crash Types (12 months)")
-        st.number_input("Right-Angle Crashes", min_value=0, max_value=50, value=0, key="right_angle",
-                        help="T-bone type crashes - correctable by signal")
-        st.number_input("Left-Turn Crashes", min_value=0, max_value=50, value=0, key="left_turn",
-                        help="Opposing left-turn crashes - correctable by signal")
-        st.number_input("Pedestrian Crashes", min_value=0, max_value=50, value=0, key="ped_crashes",
-                        help="Crashes involving pedestrians - correctable by signal")
-
-    st.subheader("Other Measures Attempted")
-    st.checkbox("Adequate trial of alternatives completed", key="alternatives_tried",
-                help="**Required for Warrant 7** - other remedial measures must have been attempted and failed")
-    st.text_area("Describe alternatives attempted", key="alternatives_desc",
-                 placeholder="e.g., Enhanced signing, improved sight distance, increased enforcement, geometric improvements...")
+    # Batch the whole page into one form so edits apply on a single
+    # submit rerun instead of one rerun per keystroke
+    with st.form("crash_data_form", border=False):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("12-Month Crash History")
+            st.number_input("Total Reportable Crashes (12 months)", min_value=0, max_value=100, value=0,
+                            key="total_crashes",
+                            help="All crashes meeting state reporting threshold in the past 12 months")
+            st.number_input("Crashes Correctable by Signal", min_value=0, max_value=100, value=0,
+                            key="correctable_crashes",
+                            help="Right-angle, left-turn, and pedestrian crashes typically correctable by signal")
+
+        with col2:
+            st.subheader("Crash Types (12 months)")
+            st.number_input("Right-Angle Crashes", min_value=0, max_value=50, value=0, key="right_angle",
+                            help="T-bone type crashes - correctable by signal")
+            st.number_input("Left-Turn Crashes", min_value=0, max_value=50, value=0, key="left_turn",
+                            help="Opposing left-turn crashes - correctable by signal")
+            st.number_input("Pedestrian Crashes", min_value=0, max_value=50, value=0, key="ped_crashes",
+                            help="Crashes involving pedestrians - correctable by signal")
+
+        st.subheader("Other Measures Attempted")
+        st.checkbox("Adequate trial of alternatives completed", key="alternatives_tried",
+                    help="**Required for Warrant 7** - other remedial measures must have been attempted and failed")
+        st.text_area("Describe alternatives attempted", key="alternatives_desc",
+                     placeholder="e.g., Enhanced signing, improved sight distance, increased enforcement, geometric improvements...")
+
+        st.form_submit_button("💾 Apply Changes", use_container_width=True)
 
     if st.session_state.get('alternatives_tried', False):
         st.success("✓ Alternatives requirement documented")
@@ -1158,51 +1365,56 @@ def render_network_coordination():
     st.info(
         "ℹ️ These warrants involve significant engineering judgment. Check applicable boxes and provide supporting data.")
 
-    col1, col2 = st.columns(2)
-
-    with col1:
-        # Warrant 6: Coordinated Signal System
-
-        st.subheader("Warrant 6: Coordinated Signal System")
-        st.checkbox("Part of coordinated signal system", key="coordinated_system",
-                    help="Intersection is or will be part of a coordinated arterial signal system")
-        st.number_input("Distance to Adjacent Signals (ft)", min_value=0, max_value=10000,
-                        value=2000, key="signal_spacing",
-                        help="Typical good progression: 1000-2640 ft")
-        st.number_input("Progression Speed (mph)", min_value=15, max_value=55,
-                        value=35, key="progression_speed",
-                        help="Design speed for signal coordination")
-
-        # Warrant 8: Roadway Network
-
-        st.subheader("Warrant 8: Roadway Network")
-        st.checkbox("Network continuity consideration", key="network_continuity",
-                    help="Installation would encourage traffic concentration on proper roadway network")
-        st.checkbox("On designated arterial/collector route", key="route_designation",
-                    help="Intersection is on a designated route in the transportation plan")
-        st.checkbox("Projected volumes meet warrants within 5 years", key="future_volumes",
-                    help="Traffic projections show warrant conditions will be met")
-
-    with col2:
-        # Warrant 9: Grade Crossing
-
-        st.subheader("Warrant 9: Intersection Near Grade Crossing")
-        st.checkbox("Railroad grade crossing nearby", key="railroad_crossing",
-                    help="Intersection is near an at-grade railroad crossing")
-        st.number_input("Distance to Railroad Crossing (ft)", min_value=0, max_value=500,
-                        value=200, key="queuing_distance",
-                        help="MUTCD requires within 140 ft for this warrant")
-        st.number_input("Train Frequency (trains/day)", min_value=0, max_value=200,
-                        value=0, key="train_frequency")
-        st.checkbox("Signal preemption required", key="preemption_needed",
-                    help="Preemption by approaching trains would improve safety")
-
-        # Engineering Notes
-
-        st.subheader("Engineering Judgment Notes")
-        st.text_area("Additional considerations", key="eng_notes",
-                     placeholder="Document any special circumstances, future development, or other factors supporting signal installation...",
-                     height=150)
+    # Batch the whole page into one form so edits apply on a single
+    # submit rerun instead of one rerun per keystroke
+    with st.form("network_form", border=False):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Warrant 6: Coordinated Signal System
+
+            st.subheader("Warrant 6: Coordinated Signal System")
+            st.checkbox("Part of coordinated signal system", key="coordinated_system",
+                        help="Intersection is or will be part of a coordinated arterial signal system")
+            st.number_input("Distance to Adjacent Signals (ft)", min_value=0, max_value=10000,
+                            value=2000, key="signal_spacing",
+                            help="Typical good progression: 1000-2640 ft")
+            st.number_input("Progression Speed (mph)", min_value=15, max_value=55,
+                            value=35, key="progression_speed",
+                            help="Design speed for signal coordination")
+
+            # Warrant 8: Roadway Network
+
+            st.subheader("Warrant 8: Roadway Network")
+            st.checkbox("Network continuity consideration", key="network_continuity",
+                        help="Installation would encourage traffic concentration on proper roadway network")
+            st.checkbox("On designated arterial/collector route", key="route_designation",
+                        help="Intersection is on a designated route in the transportation plan")
+            st.checkbox("Projected volumes meet warrants within 5 years", key="future_volumes",
+                        help="Traffic projections show warrant conditions will be met")
+
+        with col2:
+            # Warrant 9: Grade Crossing
+
+            st.subheader("Warrant 9: Intersection Near Grade Crossing")
+            st.checkbox("Railroad grade crossing nearby", key="railroad_crossing",
+                        help="Intersection is near an at-grade railroad crossing")
+            st.number_input("Distance to Railroad Crossing (ft)", min_value=0, max_value=500,
+                            value=200, key="queuing_distance",
+                            help="MUTCD requires within 140 ft for this warrant")
+            st.number_input("Train Frequency (trains/day)", min_value=0, max_value=200,
+                            value=0, key="train_frequency")
+            st.checkbox("Signal preemption required", key="preemption_needed",
+                        help="Preemption by approaching trains would improve safety")
+
+            # Engineering Notes
+
+            st.subheader("Engineering Judgment Notes")
+            st.text_area("Additional considerations", key="eng_notes",
+                         placeholder="Document any special circumstances, future development, or other factors supporting signal installation...",
+                         height=150)
+
+        st.form_submit_button("💾 Apply Changes", use_container_width=True)
 
 
 def render_settings():
@@ -1212,9 +1424,12 @@ def render_settings():
 
     col1, col2 = st.columns(2)
 
+    # Each column is one markdown element; separate subheader/markdown
+    # calls per section would each be their own server->browser delta
     with col1:
-        st.subheader("📐 Thresholds Applied")
         st.markdown("""
+        ### 📐 Thresholds Applied
+
         **MUTCD Edition:** 2009
 
         **70% Threshold Reduction** is automatically applied when:
@@ -1223,10 +1438,9 @@ def render_settings():
 
         **Major/Minor Street Assignment:**  
         Automatically determined by total volume (higher = major)
-        """)
 
-        st.subheader("📊 Warrant Requirements")
-        st.markdown("""
+        ### 📊 Warrant Requirements
+
         | Warrant | Requirement |
         |---------|-------------|
         | 1 | 8 hours meet threshold |
@@ -1241,8 +1455,9 @@ def render_settings():
         """)
 
     with col2:
-        st.subheader("📋 Data Entry Guidelines")
         st.markdown("""
+        ### 📋 Data Entry Guidelines
+
         **Traffic Counts:**
         - Street 1: Total of both approaches
         - Street 2: Higher-volume approach (one direction)
@@ -1255,167 +1470,293 @@ def render_settings():
         **Pedestrian Data:**
         - Peak hour = single highest hour
         - 4-hour average = mean of 4 highest hours
-        """)
 
-        st.subheader("📄 Export Formats")
-        st.markdown("""
+        ### 📄 Export Formats
+
         - **PDF:** Full report with charts description
         - **Excel:** Multi-sheet workbook with all data
         - **CSV:** Summary table only
         """)
 
 
+# Warrant outcomes as small ints; the display strings are produced only
+# when the summary table is built, so later checks compare integers
+# instead of scanning for the check-mark character
+class WarrantStatus(IntEnum):
+    NA = -1
+    NOT_MET = 0
+    MET = 1
+
+
+_STATUS_LABELS = {
+    WarrantStatus.MET: '✓ MET',
+    WarrantStatus.NOT_MET: '✗ NOT MET',
+    WarrantStatus.NA: '—',
+}
+
+# Chart palette, defined once so every figure builder pulls the same hex
+# strings instead of re-creating the literals per call
+_COLOR_MET = '#4caf50'
+_COLOR_NOT_MET = '#e74c3c'
+_COLOR_INACTIVE = '#e0e0e0'
+_COLOR_LINE = '#1e2a3a'
+
+# The small status charts carry no hover detail worth keeping; rendering
+# them static skips the interactive event layer in the browser entirely
+_STATIC_CHART = {'staticPlot': True, 'displayModeBar': False}
+
+
+# Figure construction runs Plotly's full schema validation, so hold the
+# built figures across reruns keyed on the tuple inputs; the charts are
+# never mutated after creation
+@st.cache_resource(show_spinner=False)
+def _w1_bar_fig(hours, vols, thresh, label):
+    """Hourly volume bars against a Warrant 1 threshold line."""
+    vols_arr = np.asarray(vols, dtype=np.int32)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=list(hours), y=vols_arr,
+                         marker_color=np.where(vols_arr >= thresh, _COLOR_MET, _COLOR_NOT_MET),
+                         name=label))
+    fig.add_hline(y=thresh, line_dash="dash", line_color="#1e2a3a",
+                  annotation_text=f"Threshold: {thresh} vph")
+    fig.update_layout(yaxis_title="vph", xaxis_tickangle=-45)
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _w4_ped_fig(curve, pct, peak_point, met):
+    """Pedestrian threshold curve plus the peak-hour point."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=curve[:, 0], y=curve[:, 1], mode='lines',
+                             name=f'Peak Hr Threshold ({pct}%)',
+                             line=dict(color=_COLOR_LINE, dash='dash')))
+    if peak_point is not None:
+        peak_major, ped_peak = peak_point
+        color = _COLOR_MET if met else _COLOR_NOT_MET
+        fig.add_trace(go.Scattergl(x=[peak_major], y=[ped_peak],
+                                   mode='markers', marker=dict(size=14, color=color, symbol='star'),
+                                   name=f"Peak: {ped_peak} peds"))
+    fig.update_layout(xaxis_title="Major Street (vph)", yaxis_title="Pedestrians/Hour")
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _w5_school_fig(school_children, school_gaps):
+    """School crossing bars against the child-count and gap limits."""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=['Schoolchildren', 'Adequate Gaps'],
+        y=[school_children, school_gaps],
+        marker_color=[_COLOR_MET if school_children >= 20 else _COLOR_NOT_MET,
+                      _COLOR_MET if school_gaps < 30 else _COLOR_NOT_MET],
+        name='Actual'
+    ))
+    # One layout update instead of four add_shape/add_annotation calls,
+    # each of which re-validates and copies the layout
+    fig.update_layout(
+        yaxis_title="Count", showlegend=False,
+        shapes=[dict(type="line", x0=-0.5, x1=0.5, y0=20, y1=20,
+                     line=dict(color=_COLOR_LINE, dash="dash")),
+                dict(type="line", x0=0.5, x1=1.5, y0=30, y1=30,
+                     line=dict(color=_COLOR_LINE, dash="dash"))],
+        annotations=[dict(x=0, y=22, text="Min: 20", showarrow=False, font=dict(size=10)),
+                     dict(x=1, y=32, text="Max: 30", showarrow=False, font=dict(size=10))])
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _w7_scatter_fig(majors, minors, meets, hours, thresh_minor):
+    """Hourly volumes against the 80% Warrant 1 minor-street line."""
+    fig = go.Figure()
+    fig.add_hline(y=thresh_minor, line_dash="dash", line_color="#1e2a3a",
+                  annotation_text=f"80% W1-A Minor: {thresh_minor} vph")
+    if majors.size:
+        fig.add_trace(go.Scattergl(
+            x=majors, y=minors, mode='markers',
+            marker=dict(size=10, color=np.where(meets, _COLOR_MET, _COLOR_NOT_MET)),
+            customdata=hours,
+            hovertemplate="%{customdata}<br>Major: %{x}<br>Minor: %{y}<extra></extra>",
+            showlegend=False))
+    fig.update_layout(xaxis_title="Major Street (vph)", yaxis_title="Minor Street (vph)")
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _w7_crash_fig(correctable_crashes):
+    """Crash-count bar shown when no traffic data is available."""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=['Correctable Crashes'],
+        y=[correctable_crashes],
+        marker_color=_COLOR_MET if correctable_crashes >= 5 else _COLOR_NOT_MET,
+        name='Crashes'
+    ))
+    fig.update_layout(
+        yaxis_title="Count (12-month)", showlegend=False,
+        shapes=[dict(type="line", x0=-0.5, x1=0.5, y0=5, y1=5,
+                     line=dict(color=_COLOR_LINE, dash="dash"))],
+        annotations=[dict(x=0, y=5.5, text="Min: 5", showarrow=False, font=dict(size=10))])
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _judgment_fig(active):
+    """Equal-height bars showing which judgment warrants are in play."""
+    active = np.asarray(active, dtype=bool)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=['W6: Coordinated', 'W8: Network', 'W9: Grade Xing'],
+        y=[1, 1, 1],  # All same height
+        marker_color=np.where(active, _COLOR_MET, _COLOR_INACTIVE),
+        text=np.where(active, 'Active', 'N/A'),
+        textposition='inside'
+    ))
+    fig.update_layout(yaxis_visible=False, showlegend=False)
+    return fig
+
+
 def render_results():
     """Render the warrant analysis results"""
+    # Nothing below is worth computing until the user asks for an analysis
+    if not st.session_state.get('analysis_run', False):
+        st.info("Click **Run Analysis** in the sidebar to compute warrants.")
+        return
+    if not st.session_state.get('results_visible', True):
+        return
+
+    _setup_plotly()
+
     st.markdown("## Warrant Analysis Results")
 
-    traffic_df = st.session_state.get('traffic_df', None)
-    major_lanes = st.session_state.get('lanes_1', 2)
-    minor_lanes = st.session_state.get('lanes_2', 1)
-    speed = st.session_state.get('approach_speed', 35)
-    population = st.session_state.get('population', 10000)
+    # Snapshot session state once; each .get below is then a plain dict
+    # lookup instead of a SessionStateProxy traversal
+    ss = dict(st.session_state)
+
+    traffic_df = ss.get('traffic_df', None)
+    major_lanes = ss.get('lanes_1', 2)
+    minor_lanes = ss.get('lanes_2', 1)
+    speed = ss.get('approach_speed', 35)
+    population = ss.get('population', 10000)
 
     # Pedestrian data
-    ped_peak = st.session_state.get('ped_peak', 0)
-    ped_4hr = st.session_state.get('ped_4hr', 0)
-    gaps = st.session_state.get('gaps', 60)
-    dist_signal = st.session_state.get('dist_signal', 1000)
+    ped_peak = ss.get('ped_peak', 0)
+    ped_4hr = ss.get('ped_4hr', 0)
+    gaps = ss.get('gaps', 60)
+    dist_signal = ss.get('dist_signal', 1000)
 
     # School data
-    school_crossing = st.session_state.get('school_crossing', False)
-    school_children = st.session_state.get('school_children', 0)
-    school_gaps = st.session_state.get('school_gaps', 0)
+    school_crossing = ss.get('school_crossing', False)
+    school_children = ss.get('school_children', 0)
+    school_gaps = ss.get('school_gaps', 0)
 
     # Crash data
-    correctable_crashes = st.session_state.get('correctable_crashes', 0)
-    alternatives_tried = st.session_state.get('alternatives_tried', False)
+    correctable_crashes = ss.get('correctable_crashes', 0)
+    alternatives_tried = ss.get('alternatives_tried', False)
 
     # Warrant 6 data
-    coordinated_system = st.session_state.get('coordinated_system', False)
-    signal_spacing = st.session_state.get('signal_spacing', 2000)
-    progression_speed = st.session_state.get('progression_speed', 35)
+    coordinated_system = ss.get('coordinated_system', False)
+    signal_spacing = ss.get('signal_spacing', 2000)
+    progression_speed = ss.get('progression_speed', 35)
 
     # Warrant 8 data
-    network_continuity = st.session_state.get('network_continuity', False)
-    route_designation = st.session_state.get('route_designation', False)
-    future_volumes = st.session_state.get('future_volumes', False)
+    network_continuity = ss.get('network_continuity', False)
+    route_designation = ss.get('route_designation', False)
+    future_volumes = ss.get('future_volumes', False)
 
     # Warrant 9 data
-    railroad_crossing = st.session_state.get('railroad_crossing', False)
-    queuing_distance = st.session_state.get('queuing_distance', 200)
-    train_frequency = st.session_state.get('train_frequency', 0)
-    preemption_needed = st.session_state.get('preemption_needed', False)
-
-    # Evaluate all warrants
-    w1_result = evaluate_warrant1(traffic_df, major_lanes, minor_lanes, speed, population)
-    w2_result = evaluate_warrant2(traffic_df, major_lanes, minor_lanes, speed, population)
-    w3_result = evaluate_warrant3(traffic_df, major_lanes, minor_lanes, speed, population)
+    railroad_crossing = ss.get('railroad_crossing', False)
+    queuing_distance = ss.get('queuing_distance', 200)
+    train_frequency = ss.get('train_frequency', 0)
+    preemption_needed = ss.get('preemption_needed', False)
+
+    # Evaluate all warrants. The volume-based warrants have nothing to
+    # analyze until counts are entered, so skip their evaluators entirely
+    # on a blank grid — the display code already handles None results.
+    has_traffic = (traffic_df is not None and len(traffic_df) > 0
+                   and int(traffic_df[['Street 1 (vph)', 'Street 2 (vph)']].to_numpy().sum()) > 0)
+    if has_traffic:
+        w1_result = evaluate_warrant1(traffic_df, major_lanes, minor_lanes, speed, population)
+        w2_result = evaluate_warrant2(traffic_df, major_lanes, minor_lanes, speed, population)
+        w3_result = evaluate_warrant3(traffic_df, major_lanes, minor_lanes, speed, population)
+        w7_result = evaluate_warrant7(traffic_df, major_lanes, minor_lanes, speed, population,
+                                      correctable_crashes, alternatives_tried)
+    else:
+        w1_result = w2_result = w3_result = w7_result = None
     w4_result = evaluate_warrant4(traffic_df, speed, population, ped_peak, ped_4hr, gaps, dist_signal)
     w5_result = evaluate_warrant5(school_crossing, school_children, school_gaps)
     w6_result = evaluate_warrant6(coordinated_system, signal_spacing, progression_speed)
-    w7_result = evaluate_warrant7(traffic_df, major_lanes, minor_lanes, speed, population,
-                                  correctable_crashes, alternatives_tried)
     w8_result = evaluate_warrant8(network_continuity, route_designation, future_volumes)
     w9_result = evaluate_warrant9(railroad_crossing, train_frequency, queuing_distance, preemption_needed)
 
     def get_status(result):
         if result is None or result.get('met') is None:
-            return '—'
+            return WarrantStatus.NA
         elif result.get('met'):
-            return '✓ MET'
+            return WarrantStatus.MET
         else:
-            return '✗ NOT MET'
-
-    w1_status = get_status(w1_result)
-    w2_status = get_status(w2_result)
-    w3_status = get_status(w3_result)
-    w4_status = get_status(w4_result)
-    w5_status = get_status(w5_result)
-    w6_status = get_status(w6_result)
-    w7_status = get_status(w7_result)
-    w8_status = get_status(w8_result)
-    w9_status = get_status(w9_result)
-
-    # Build display strings
-    w1_threshold = w1_data = w1_notes = '—'
-    w2_threshold = w2_data = w2_notes = '—'
-    w3_threshold = w3_data = w3_notes = '—'
-    w4_threshold = w4_data = w4_notes = '—'
-    w5_threshold = w5_data = w5_notes = '—'
-    w6_threshold = w6_data = w6_notes = '—'
-    w7_threshold = w7_data = w7_notes = '—'
-    w8_threshold = w8_data = w8_notes = '—'
-    w9_threshold = w9_data = w9_notes = '—'
-
-    if w1_result and w1_result.get('threshold_used'):
-        thresh = w1_result['threshold_used']
-        w1_threshold = f"{thresh['condition_a'][0]}/{thresh['condition_a'][1]} vph ({thresh['pct']}%)"
-        w1_data = f"{w1_result['hours_met']}/8 hours"
-        w1_notes = w1_result.get('details', '')
-
-    if w2_result and w2_result.get('curve_points'):
-        w2_threshold = f"Curve ({w2_result['pct']}%)"
-        w2_data = f"{w2_result['hours_met']}/4 hours"
-        w2_notes = w2_result.get('details', '')
-
-    if w3_result and w3_result.get('peak_hour'):
-        w3_threshold = f"Curve ({w3_result['pct']}%)"
-        w3_data = f"Peak: {w3_result['peak_hour']}"
-        w3_notes = w3_result.get('details', '')
-
-    if w4_result:
-        w4_threshold = f"Curve ({w4_result.get('pct', '100')}%)"
-        w4_data = f"{ped_peak} peak / {ped_4hr} 4-hr"
-        w4_notes = w4_result.get('details', '')
-
-    if w5_result:
-        w5_threshold = f"Gaps < Period"
-        w5_data = f"{school_children} children"
-        w5_notes = w5_result.get('details', '')
-
-    if w6_result:
-        w6_threshold = "1000-2640 ft"
-        w6_data = f"{signal_spacing} ft spacing"
-        w6_notes = w6_result.get('details', '')
-
-    if w7_result:
-        w7_threshold = "≥5 crashes + 80% vol"
-        w7_data = f"{correctable_crashes} crashes, {w7_result.get('hours_meeting_volume', 0)}/8 hrs"
-        w7_notes = w7_result.get('details', '')
-
-    if w8_result:
-        w8_threshold = "Eng. judgment"
-        w8_data = "Route + future vol"
-        w8_notes = w8_result.get('details', '')
-
-    if w9_result:
-        w9_threshold = "≤140 ft to RR"
-        w9_data = f"{queuing_distance} ft, {train_frequency} trains/day"
-        w9_notes = w9_result.get('details', '')
+            return WarrantStatus.NOT_MET
+
+    # One pass over the results gives both the display statuses and the
+    # met count, instead of re-scanning the status strings afterwards
+    warrant_items = [
+        ('1. Eight-Hour Volume', w1_result), ('2. Four-Hour Volume', w2_result),
+        ('3. Peak Hour', w3_result), ('4. Pedestrian Volume', w4_result),
+        ('5. School Crossing', w5_result), ('6. Coordinated System', w6_result),
+        ('7. Crash Experience', w7_result), ('8. Roadway Network', w8_result),
+        ('9. Grade Crossing', w9_result),
+    ]
+    statuses = [get_status(r) for _, r in warrant_items]
+    met_count = sum(s is WarrantStatus.MET for s in statuses)
+
+    # Build display strings: one (data, threshold, notes) formatter per
+    # warrant, driven by a single loop instead of nine if-blocks. The
+    # first element guards on a result field where the old code did.
+    formatters = [
+        ('threshold_used', lambda r: (
+            f"{r['hours_met']}/8 hours",
+            f"{r['threshold_used']['condition_a'][0]}/{r['threshold_used']['condition_a'][1]} vph"
+            f" ({r['threshold_used']['pct']}%)",
+            r.get('details', ''))),
+        ('curve_points', lambda r: (
+            f"{r['hours_met']}/4 hours", f"Curve ({r['pct']}%)", r.get('details', ''))),
+        ('peak_hour', lambda r: (
+            f"Peak: {r['peak_hour']}", f"Curve ({r['pct']}%)", r.get('details', ''))),
+        (None, lambda r: (
+            f"{ped_peak} peak / {ped_4hr} 4-hr", f"Curve ({r.get('pct', '100')}%)", r.get('details', ''))),
+        (None, lambda r: (
+            f"{school_children} children", "Gaps < Period", r.get('details', ''))),
+        (None, lambda r: (
+            f"{signal_spacing} ft spacing", "1000-2640 ft", r.get('details', ''))),
+        (None, lambda r: (
+            f"{correctable_crashes} crashes, {r.get('hours_meeting_volume', 0)}/8 hrs",
+            "≥5 crashes + 80% vol", r.get('details', ''))),
+        (None, lambda r: (
+            "Route + future vol", "Eng. judgment", r.get('details', ''))),
+        (None, lambda r: (
+            f"{queuing_distance} ft, {train_frequency} trains/day", "≤140 ft to RR", r.get('details', ''))),
+    ]
+
+    # Guard fields may be ndarrays (e.g. curve_points), so test presence
+    # rather than truthiness — bool(ndarray) raises for multi-element arrays
+    display = [fmt(r) if r is not None and (guard is None or r.get(guard) is not None) else ('—', '—', '—')
+               for (guard, fmt), (_, r) in zip(formatters, warrant_items)]
 
     # Summary table
 
     st.subheader("Summary")
 
     results_df = pd.DataFrame({
-        'Warrant': ['1. Eight-Hour Volume', '2. Four-Hour Volume', '3. Peak Hour',
-                    '4. Pedestrian Volume', '5. School Crossing', '6. Coordinated System',
-                    '7. Crash Experience', '8. Roadway Network', '9. Grade Crossing'],
-        'Status': [w1_status, w2_status, w3_status, w4_status, w5_status,
-                   w6_status, w7_status, w8_status, w9_status],
-        'Data': [w1_data, w2_data, w3_data, w4_data, w5_data,
-                 w6_data, w7_data, w8_data, w9_data],
-        'Threshold': [w1_threshold, w2_threshold, w3_threshold, w4_threshold, w5_threshold,
-                      w6_threshold, w7_threshold, w8_threshold, w9_threshold],
-        'Notes': [w1_notes, w2_notes, w3_notes, w4_notes, w5_notes,
-                  w6_notes, w7_notes, w8_notes, w9_notes]
+        'Warrant': [name for name, _ in warrant_items],
+        'Status': [_STATUS_LABELS[s] for s in statuses],
+        'Data': [d for d, _, _ in display],
+        'Threshold': [t for _, t, _ in display],
+        'Notes': [n for _, _, n in display]
     })
 
-    st.table(results_df)
+    # st.dataframe ships the frame over Arrow and diff-renders on the
+    # frontend, where st.table rebuilds its full static HTML every rerun
+    st.dataframe(results_df, use_container_width=True, hide_index=True)
 
-    # Count met warrants
-    met_count = sum(1 for s in [w1_status, w2_status, w3_status, w4_status, w5_status,
-                                w6_status, w7_status, w8_status, w9_status] if '✓' in s)
     if met_count > 0:
         st.success(f"🚦 **{met_count} warrant(s) satisfied** — Signal installation may be justified")
     else:
@@ -1427,10 +1768,10 @@ def render_results():
 
     # Gather project info for exports
     project_info = {
-        'project_name': st.session_state.get('project_name', ''),
-        'location': st.session_state.get('location', ''),
-        'street_1': st.session_state.get('street_1', ''),
-        'street_2': st.session_state.get('street_2', ''),
+        'project_name': ss.get('project_name', ''),
+        'location': ss.get('location', ''),
+        'street_1': ss.get('street_1', ''),
+        'street_2': ss.get('street_2', ''),
         'approach_speed': speed,
         'population': population,
         'lanes_1': major_lanes,
@@ -1446,14 +1787,15 @@ def render_results():
 
     export_col1, export_col2, export_col3 = st.columns(3)
 
+    reports = _report_payloads(results_df, traffic_df, project_info, warrant_results)
+
     with export_col1:
         # PDF Export
-        pdf_data = generate_pdf_report(results_df, traffic_df, project_info, warrant_results)
         project_name_clean = project_info.get('project_name', 'warrant_analysis').replace(' ',
                                                                                           '_') or 'warrant_analysis'
         st.download_button(
             label="📄 Download PDF Report",
-            data=pdf_data,
+            data=reports['pdf'],
             file_name=f"{project_name_clean}_report.pdf",
             mime="application/pdf",
             use_container_width=True
@@ -1461,10 +1803,9 @@ def render_results():
 
     with export_col2:
         # Excel Export
-        excel_data = generate_excel_report(results_df, traffic_df, project_info)
         st.download_button(
             label="📊 Download Excel",
-            data=excel_data,
+            data=reports['xlsx'],
             file_name=f"{project_name_clean}_data.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             use_container_width=True
@@ -1472,10 +1813,9 @@ def render_results():
 
     with export_col3:
         # CSV Export
-        csv_data = generate_csv_report(results_df)
         st.download_button(
             label="📋 Download CSV",
-            data=csv_data,
+            data=reports['csv'],
             file_name=f"{project_name_clean}_summary.csv",
             mime="text/csv",
             use_container_width=True
@@ -1490,19 +1830,10 @@ def render_results():
 
         if w1_result and w1_result.get('hourly_results'):
             hourly = w1_result['hourly_results']
-            hours = [h['hour'] for h in hourly]
-            major_vols = [h['major_vol'] for h in hourly]
-            thresh_major = hourly[0]['thresh_a_major']
-
-            colors = ['#4caf50' if v >= thresh_major else '#e74c3c' for v in major_vols]
-
-            fig = go.Figure()
-            fig.add_trace(go.Bar(x=hours, y=major_vols, marker_color=colors,
-                                 name=f'Major ({w1_result.get("major_street", "Street 1")})'))
-            fig.add_hline(y=thresh_major, line_dash="dash", line_color="#1e2a3a",
-                          annotation_text=f"Threshold: {thresh_major} vph")
-            fig.update_layout(height=280, margin=dict(l=20, r=20, t=30, b=40),
-                              yaxis_title="vph", xaxis_tickangle=-45)
+            fig = _w1_bar_fig(tuple(h['hour'] for h in hourly),
+                              tuple(h['major_vol'] for h in hourly),
+                              hourly[0]['thresh_a_major'],
+                              f'Major ({w1_result.get("major_street", "Street 1")})')
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.caption("Enter traffic data to see analysis")
@@ -1513,19 +1844,10 @@ def render_results():
 
         if w1_result and w1_result.get('hourly_results'):
             hourly = w1_result['hourly_results']
-            hours = [h['hour'] for h in hourly]
-            minor_vols = [h['minor_vol'] for h in hourly]
-            thresh_minor = hourly[0]['thresh_a_minor']
-
-            colors = ['#4caf50' if v >= thresh_minor else '#e74c3c' for v in minor_vols]
-
-            fig2 = go.Figure()
-            fig2.add_trace(go.Bar(x=hours, y=minor_vols, marker_color=colors,
-                                  name=f'Minor ({w1_result.get("minor_street", "Street 2")})'))
-            fig2.add_hline(y=thresh_minor, line_dash="dash", line_color="#1e2a3a",
-                           annotation_text=f"Threshold: {thresh_minor} vph")
-            fig2.update_layout(height=280, margin=dict(l=20, r=20, t=30, b=40),
-                               yaxis_title="vph", xaxis_tickangle=-45)
+            fig2 = _w1_bar_fig(tuple(h['hour'] for h in hourly),
+                               tuple(h['minor_vol'] for h in hourly),
+                               hourly[0]['thresh_a_minor'],
+                               f'Minor ({w1_result.get("minor_street", "Street 2")})')
             st.plotly_chart(fig2, use_container_width=True)
         else:
             st.caption("Enter traffic data to see analysis")
@@ -1543,21 +1865,24 @@ def render_results():
 
             fig3 = go.Figure()
 
-            curve_x = [p[0] for p in curve]
-            curve_y = [p[1] for p in curve]
+            curve_x, curve_y = curve[:, 0], curve[:, 1]
             fig3.add_trace(go.Scatter(x=curve_x, y=curve_y, mode='lines',
                                       name=f'Threshold ({w2_result["pct"]}%)',
-                                      line=dict(color='#1e2a3a', dash='dash')))
-
-            for h in hourly:
-                if h['major_vol'] > 0:
-                    color = '#4caf50' if h['above_curve'] else '#e74c3c'
-                    fig3.add_trace(go.Scatter(x=[h['major_vol']], y=[h['minor_vol']],
+                                      line=dict(color=_COLOR_LINE, dash='dash')))
+
+            # Two batched marker traces (above/below curve) instead of one
+            # single-point trace per hour keeps the figure payload small
+            above = [(h['major_vol'], h['minor_vol'], h['hour'])
+                     for h in hourly if h['major_vol'] > 0 and h['above_curve']]
+            below = [(h['major_vol'], h['minor_vol'], h['hour'])
+                     for h in hourly if h['major_vol'] > 0 and not h['above_curve']]
+            for points, color in ((above, _COLOR_MET), (below, _COLOR_NOT_MET)):
+                if points:
+                    fig3.add_trace(go.Scatter(x=[p[0] for p in points], y=[p[1] for p in points],
                                               mode='markers', marker=dict(size=10, color=color),
-                                              name=h['hour'], showlegend=False))
+                                              text=[p[2] for p in points], showlegend=False))
 
-            fig3.update_layout(height=280, margin=dict(l=20, r=20, t=30, b=40),
-                               xaxis_title="Major Street (vph)", yaxis_title="Minor Street (vph)")
+            fig3.update_layout(xaxis_title="Major Street (vph)", yaxis_title="Minor Street (vph)")
             st.plotly_chart(fig3, use_container_width=True)
             st.caption(f"**{w2_result['hours_met']}/4 hours** above curve")
         else:
@@ -1572,19 +1897,17 @@ def render_results():
 
             fig4 = go.Figure()
 
-            curve_x = [p[0] for p in curve]
-            curve_y = [p[1] for p in curve]
+            curve_x, curve_y = curve[:, 0], curve[:, 1]
             fig4.add_trace(go.Scatter(x=curve_x, y=curve_y, mode='lines',
                                       name=f'Threshold ({w3_result["pct"]}%)',
-                                      line=dict(color='#1e2a3a', dash='dash')))
+                                      line=dict(color=_COLOR_LINE, dash='dash')))
 
-            color = '#4caf50' if w3_result['met'] else '#e74c3c'
+            color = _COLOR_MET if w3_result['met'] else _COLOR_NOT_MET
             fig4.add_trace(go.Scatter(x=[w3_result['peak_major']], y=[w3_result['peak_minor']],
                                       mode='markers', marker=dict(size=14, color=color, symbol='star'),
                                       name=f"Peak: {w3_result['peak_hour']}"))
 
-            fig4.update_layout(height=280, margin=dict(l=20, r=20, t=30, b=40),
-                               xaxis_title="Major Street (vph)", yaxis_title="Minor Street (vph)")
+            fig4.update_layout(xaxis_title="Major Street (vph)", yaxis_title="Minor Street (vph)")
             st.plotly_chart(fig4, use_container_width=True)
             st.caption(
                 f"**Peak Hour:** {w3_result['peak_hour']} — {w3_result['peak_major']:.0f} / {w3_result['peak_minor']:.0f} vph")
@@ -1598,30 +1921,14 @@ def render_results():
 
         st.subheader("Warrant 4: Pedestrian Volume")
 
-        if w4_result and w4_result.get('peak_hour_curve'):
-            curve = w4_result['peak_hour_curve']
-
-            fig5 = go.Figure()
-
-            curve_x = [p[0] for p in curve]
-            curve_y = [p[1] for p in curve]
-            fig5.add_trace(go.Scatter(x=curve_x, y=curve_y, mode='lines',
-                                      name=f'Peak Hr Threshold ({w4_result["pct"]}%)',
-                                      line=dict(color='#1e2a3a', dash='dash')))
-
-            if traffic_df is not None and len(traffic_df) > 0:
-                street1_total = traffic_df['Street 1 (vph)'].sum()
-                street2_total = traffic_df['Street 2 (vph)'].sum()
-                major_col = 'Street 1 (vph)' if street1_total >= street2_total else 'Street 2 (vph)'
-                peak_major = traffic_df[major_col].max()
-
-                color = '#4caf50' if w4_result.get('peak_hour_met') else '#e74c3c'
-                fig5.add_trace(go.Scatter(x=[peak_major], y=[ped_peak],
-                                          mode='markers', marker=dict(size=14, color=color, symbol='star'),
-                                          name=f"Peak: {ped_peak} peds"))
+        if w4_result and w4_result.get('peak_hour_curve') is not None:
+            # The cached evaluator already found the major street and its
+            # peak volume; reuse them instead of re-scanning the frame
+            peak_major = w4_result.get('peak_major')
+            peak_point = (peak_major, ped_peak) if peak_major is not None else None
 
-            fig5.update_layout(height=280, margin=dict(l=20, r=20, t=30, b=40),
-                               xaxis_title="Major Street (vph)", yaxis_title="Pedestrians/Hour")
+            fig5 = _w4_ped_fig(w4_result['peak_hour_curve'], w4_result['pct'],
+                               peak_point, bool(w4_result.get('peak_hour_met')))
             st.plotly_chart(fig5, use_container_width=True)
 
             gap_status = "✓" if gaps < 60 else "✗"
@@ -1634,27 +1941,8 @@ def render_results():
         st.subheader("Warrant 5: School Crossing")
 
         if school_crossing:
-            fig6 = go.Figure()
-
-            fig6.add_trace(go.Bar(
-                x=['Schoolchildren', 'Adequate Gaps'],
-                y=[school_children, school_gaps],
-                marker_color=['#4caf50' if school_children >= 20 else '#e74c3c',
-                              '#4caf50' if school_gaps < 30 else '#e74c3c'],
-                name='Actual'
-            ))
-
-            fig6.add_shape(type="line", x0=-0.5, x1=0.5, y0=20, y1=20,
-                           line=dict(color="#1e2a3a", dash="dash"))
-            fig6.add_shape(type="line", x0=0.5, x1=1.5, y0=30, y1=30,
-                           line=dict(color="#1e2a3a", dash="dash"))
-
-            fig6.add_annotation(x=0, y=22, text="Min: 20", showarrow=False, font=dict(size=10))
-            fig6.add_annotation(x=1, y=32, text="Max: 30", showarrow=False, font=dict(size=10))
-
-            fig6.update_layout(height=280, margin=dict(l=20, r=20, t=30, b=40),
-                               yaxis_title="Count", showlegend=False)
-            st.plotly_chart(fig6, use_container_width=True)
+            fig6 = _w5_school_fig(school_children, school_gaps)
+            st.plotly_chart(fig6, use_container_width=True, config=_STATIC_CHART)
             st.caption(
                 f"**Children:** {school_children} (min 20)  |  **Gaps:** {school_gaps} (must be < crossing period)")
         else:
@@ -1668,26 +1956,17 @@ def render_results():
         st.subheader("Warrant 7: Crash Experience")
 
         if w7_result and w7_result.get('hourly_results'):
+            # Structure-of-arrays pull: one pass over the hourly dicts, then
+            # everything downstream is vectorized
             hourly = w7_result['hourly_results']
-
-            fig7 = go.Figure()
-
-            # Plot 80% Warrant 1 threshold line (Condition A)
-            thresh_a = w7_result['thresh_a_80']
-            fig7.add_hline(y=thresh_a[1], line_dash="dash", line_color="#1e2a3a",
-                           annotation_text=f"80% W1-A Minor: {thresh_a[1]} vph")
-
-            # Plot hourly data points
-            for h in hourly:
-                if h['major_vol'] > 0:
-                    color = '#4caf50' if h['meets_volume'] else '#e74c3c'
-                    fig7.add_trace(go.Scatter(x=[h['major_vol']], y=[h['minor_vol']],
-                                              mode='markers', marker=dict(size=10, color=color),
-                                              name=h['hour'], showlegend=False,
-                                              hovertemplate=f"{h['hour']}<br>Major: {h['major_vol']}<br>Minor: {h['minor_vol']}"))
-
-            fig7.update_layout(height=280, margin=dict(l=20, r=20, t=30, b=40),
-                               xaxis_title="Major Street (vph)", yaxis_title="Minor Street (vph)")
+            n = len(hourly)
+            majors = np.fromiter((h['major_vol'] for h in hourly), dtype=np.int32, count=n)
+            minors = np.fromiter((h['minor_vol'] for h in hourly), dtype=np.int32, count=n)
+            meets = np.fromiter((h['meets_volume'] for h in hourly), dtype=bool, count=n)
+            hours_arr = np.array([h['hour'] for h in hourly])
+            mask = majors > 0
+            fig7 = _w7_scatter_fig(majors[mask], minors[mask], meets[mask], hours_arr[mask],
+                                   w7_result['thresh_a_80'][1])
             st.plotly_chart(fig7, use_container_width=True)
 
             cond_a = "✓" if w7_result.get('condition_a') else "✗"
@@ -1696,22 +1975,8 @@ def render_results():
             st.caption(f"**Conditions:** A (alternatives) {cond_a} | B (crashes) {cond_b} | C (volume) {cond_c}")
         else:
             # Show crash summary even without traffic data
-            fig7 = go.Figure()
-
-            fig7.add_trace(go.Bar(
-                x=['Correctable Crashes'],
-                y=[correctable_crashes],
-                marker_color='#4caf50' if correctable_crashes >= 5 else '#e74c3c',
-                name='Crashes'
-            ))
-
-            fig7.add_shape(type="line", x0=-0.5, x1=0.5, y0=5, y1=5,
-                           line=dict(color="#1e2a3a", dash="dash"))
-            fig7.add_annotation(x=0, y=5.5, text="Min: 5", showarrow=False, font=dict(size=10))
-
-            fig7.update_layout(height=280, margin=dict(l=20, r=20, t=30, b=40),
-                               yaxis_title="Count (12-month)", showlegend=False)
-            st.plotly_chart(fig7, use_container_width=True)
+            fig7 = _w7_crash_fig(correctable_crashes)
+            st.plotly_chart(fig7, use_container_width=True, config=_STATIC_CHART)
 
             alt_status = "✓" if alternatives_tried else "✗"
             st.caption(f"**Crashes:** {correctable_crashes}/5 required | **Alternatives tried:** {alt_status}")
@@ -1721,42 +1986,26 @@ def render_results():
         st.subheader("Warrants 6, 8, 9: Engineering Judgment")
 
         # Summary of engineering judgment warrants
-        fig8 = go.Figure()
-
-        warrant_names = ['W6: Coordinated', 'W8: Network', 'W9: Grade Xing']
-        warrant_values = [1 if coordinated_system else 0,
-                          1 if (network_continuity and route_designation) else 0,
-                          1 if (railroad_crossing and queuing_distance <= 140) else 0]
-        warrant_colors = ['#4caf50' if v else '#e0e0e0' for v in warrant_values]
-
-        fig8.add_trace(go.Bar(
-            x=warrant_names,
-            y=[1, 1, 1],  # All same height
-            marker_color=warrant_colors,
-            text=['Active' if v else 'N/A' for v in warrant_values],
-            textposition='inside'
-        ))
-
-        fig8.update_layout(height=280, margin=dict(l=20, r=20, t=30, b=40),
-                           yaxis_visible=False, showlegend=False)
-        st.plotly_chart(fig8, use_container_width=True)
+        fig8 = _judgment_fig((bool(coordinated_system),
+                              bool(network_continuity and route_designation),
+                              bool(railroad_crossing and queuing_distance <= 140)))
+        st.plotly_chart(fig8, use_container_width=True, config=_STATIC_CHART)
 
         st.caption("Green = Conditions present for evaluation | Configure in Network/Coordination tab")
 
 
-# Route to appropriate page
-if st.session_state.current_page == "Project Details":
-    render_project_details()
-elif st.session_state.current_page == "Traffic Counts":
-    render_traffic_counts()
-elif st.session_state.current_page == "Pedestrian/Bike":
-    render_pedestrian_bike()
-elif st.session_state.current_page == "Crash Data":
-    render_crash_data()
-elif st.session_state.current_page == "Network/Coordination":
-    render_network_coordination()
-elif st.session_state.current_page == "About":
-    render_settings()
-
-st.markdown("---")
-render_results()
\ No newline at end of file
+# Route to appropriate page via one dict lookup
+_PAGES = {
+    "Project Details": render_project_details,
+    "Traffic Counts": render_traffic_counts,
+    "Pedestrian/Bike": render_pedestrian_bike,
+    "Crash Data": render_crash_data,
+    "Network/Coordination": render_network_coordination,
+    "About": render_settings,
+}
+_PAGES[st.session_state.current_page]()
+
+# The About page is pure documentation — no results pipeline there
+if st.session_state.current_page != "About":
+    st.markdown("---")
+    render_results()
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""Smoke test: the results page must render without raising.
+
+The warrant evaluators return ndarray curve fields, and a careless
+truthiness check on one of them crashes the whole results view, so this
+drives the app end-to-end with real counts via Streamlit's AppTest.
+"""
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+
+def _run_app(**session_state):
+    at = AppTest.from_file("app.py", default_timeout=30)
+    for key, value in session_state.items():
+        at.session_state[key] = value
+    at.run()
+    assert not at.exception, at.exception
+    return at
+
+
+def test_results_render_with_traffic_counts():
+    traffic_df = pd.read_csv("test_traffic_data.csv")
+    at = _run_app(traffic_df=traffic_df, analysis_run=True)
+    # The summary table made it onto the page
+    assert any(df is not None for df in at.dataframe)
+
+
+def test_results_render_with_zero_counts_and_adequate_gaps():
+    # Zero-count grid with gaps below 60 exercises the Warrant 4 curve
+    # branch without any usable volume data
+    blank = pd.DataFrame({
+        'Hour': [f"{h}:00" for h in range(6, 22)],
+        'Street 1 (vph)': [0] * 16,
+        'Street 2 (vph)': [0] * 16,
+    })
+    _run_app(traffic_df=blank, analysis_run=True, gaps=40)
+
+
+def test_results_hidden_until_analysis_run():
+    at = _run_app()
+    assert any("Run Analysis" in str(info.value) for info in at.info)
@@ -0,0 +1,110 @@
+"""MUTCD 2009 threshold data packed into NumPy structure-of-arrays tables.
+
+The source tables (Table 4C-1 for Warrant 1, Figures 4C-1 through 4C-4
+for Warrants 2 and 3) are kept as readable dict literals and compiled
+into contiguous ndarrays once at import. Evaluators index straight into
+the arrays via the shared axis orderings below.
+"""
+import numpy as np
+
+# Axis orderings shared by all tables
+LANE_IDX = {(1, 1): 0, (2, 1): 1, (2, 2): 2, (1, 2): 3}
+COND_IDX = {'a': 0, 'b': 1}
+W1_PCT_IDX = {'100': 0, '80': 1, '70': 2, '56': 3}
+PCT_IDX = {'100': 0, '70': 1}
+HOUR_IDX = {'four_hour': 0, 'peak_hour': 1}
+
+# Warrant 1: Table 4C-1
+WARRANT1_THRESHOLDS = {
+    'condition_a': {
+        (1, 1): {'100': (500, 150), '80': (400, 120), '70': (350, 105), '56': (280, 84)},
+        (2, 1): {'100': (600, 150), '80': (480, 120), '70': (420, 105), '56': (336, 84)},
+        (2, 2): {'100': (600, 200), '80': (480, 160), '70': (420, 140), '56': (336, 112)},
+        (1, 2): {'100': (500, 200), '80': (400, 160), '70': (350, 140), '56': (280, 112)},
+    },
+    'condition_b': {
+        (1, 1): {'100': (750, 75), '80': (600, 60), '70': (525, 53), '56': (420, 42)},
+        (2, 1): {'100': (900, 75), '80': (720, 60), '70': (630, 53), '56': (504, 42)},
+        (2, 2): {'100': (900, 100), '80': (720, 80), '70': (630, 70), '56': (504, 56)},
+        (1, 2): {'100': (750, 100), '80': (600, 80), '70': (525, 70), '56': (420, 56)},
+    }
+}
+
+# Warrant 2: Figure 4C-1 / 4C-2 curve points (major_vph, minor_vph threshold)
+WARRANT2_CURVES = {
+    '100': {
+        (1, 1): [(300, 115), (400, 100), (500, 90), (600, 80), (700, 70), (800, 60), (900, 50), (1000, 40)],
+        (2, 1): [(400, 115), (500, 100), (600, 90), (700, 80), (800, 70), (900, 60), (1000, 50), (1100, 40)],
+        (2, 2): [(400, 150), (500, 135), (600, 120), (700, 105), (800, 95), (900, 85), (1000, 75), (1100, 65)],
+        (1, 2): [(300, 150), (400, 135), (500, 120), (600, 105), (700, 95), (800, 85), (900, 75), (1000, 65)],
+    },
+    '70': {
+        (1, 1): [(210, 80), (280, 70), (350, 63), (420, 56), (490, 49), (560, 42), (630, 35), (700, 28)],
+        (2, 1): [(280, 80), (350, 70), (420, 63), (490, 56), (560, 49), (630, 42), (700, 35), (770, 28)],
+        (2, 2): [(280, 105), (350, 95), (420, 84), (490, 74), (560, 67), (630, 60), (700, 53), (770, 46)],
+        (1, 2): [(210, 105), (280, 95), (350, 84), (420, 74), (490, 67), (560, 60), (630, 53), (700, 46)],
+    }
+}
+
+# Warrant 3: Figure 4C-3 / 4C-4 curve points
+WARRANT3_CURVES = {
+    '100': {
+        (1, 1): [(400, 150), (500, 135), (600, 120), (700, 105), (800, 100), (900, 100), (1000, 100)],
+        (2, 1): [(500, 150), (600, 135), (700, 120), (800, 105), (900, 100), (1000, 100), (1100, 100)],
+        (2, 2): [(500, 200), (600, 180), (700, 160), (800, 150), (900, 150), (1000, 150), (1100, 150)],
+        (1, 2): [(400, 200), (500, 180), (600, 160), (700, 150), (800, 150), (900, 150), (1000, 150)],
+    },
+    '70': {
+        (1, 1): [(280, 105), (350, 95), (420, 84), (490, 74), (560, 70), (630, 70), (700, 70)],
+        (2, 1): [(350, 105), (420, 95), (490, 84), (560, 74), (630, 70), (700, 70), (770, 70)],
+        (2, 2): [(350, 140), (420, 126), (490, 112), (560, 105), (630, 105), (700, 105), (770, 105)],
+        (1, 2): [(280, 140), (350, 126), (420, 112), (490, 105), (560, 105), (630, 105), (700, 105)],
+    }
+}
+
+
+# Warrant 4: Pedestrian Volume - Figure 4C-5 through 4C-8
+WARRANT4_CURVES = {
+    'four_hour_100': [(300, 190), (400, 150), (500, 130), (600, 115), (700, 107), (800, 100), (900, 100), (1000, 100)],
+    'four_hour_70': [(210, 133), (280, 105), (350, 91), (420, 81), (490, 75), (560, 70), (630, 70), (700, 70)],
+    'peak_hour_100': [(300, 380), (400, 300), (500, 260), (600, 230), (700, 214), (800, 200), (900, 200), (1000, 200)],
+    'peak_hour_70': [(210, 266), (280, 210), (350, 182), (420, 161), (490, 150), (560, 140), (630, 140), (700, 140)],
+}
+
+
+def _warrant1_table(source):
+    """Pack Table 4C-1 into W1[cond, lane, pct] -> (major, minor)."""
+    table = np.zeros((2, 4, 4, 2), dtype=np.int16)
+    for cond, by_lane in source.items():
+        for lane_key, by_pct in by_lane.items():
+            for pct, pair in by_pct.items():
+                table[COND_IDX[cond[-1]], LANE_IDX[lane_key], W1_PCT_IDX[pct]] = pair
+    return table
+
+
+def _curve_table(source, n_points):
+    """Pack a curve figure into table[pct, lane] -> (n_points, 2) ordered by x."""
+    table = np.zeros((2, 4, n_points, 2), dtype=np.float32)
+    for pct, by_lane in source.items():
+        for lane_key, pts in by_lane.items():
+            # The literals are defined in ascending major_vph order; np.interp
+            # relies on that, so enforce it here instead of re-sorting per call
+            assert pts == sorted(pts), f"curve points out of order: {pct} / {lane_key}"
+            table[PCT_IDX[pct], LANE_IDX[lane_key]] = pts
+    return table
+
+
+def _warrant4_table(source):
+    """Pack the pedestrian figures into W4[hour_type, pct] -> (8, 2) ordered by x."""
+    table = np.zeros((2, 2, 8, 2), dtype=np.float32)
+    for key, pts in source.items():
+        hour_type, pct = key.rsplit('_', 1)
+        assert pts == sorted(pts), f"curve points out of order: {key}"
+        table[HOUR_IDX[hour_type], PCT_IDX[pct]] = pts
+    return table
+
+
+W1 = _warrant1_table(WARRANT1_THRESHOLDS)
+W2 = _curve_table(WARRANT2_CURVES, 8)
+W3 = _curve_table(WARRANT3_CURVES, 7)
+W4 = _warrant4_table(WARRANT4_CURVES)